@@ -8,20 +8,14 @@ all components including database, background workers, and routes.
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 
-from flask import Flask
+if TYPE_CHECKING:
+    from flask import Flask
 
-from .config import get_settings
-from .twilio_client import TwilioService
-from .webhooks import webhooks_bp
-from .logger import configure_logging
-from .database import init_app as init_database, apply_ai_env_defaults
-from .ui import ui_bp
-from .auto_reply import start_auto_reply_worker
-from .reminder import start_reminder_worker
-from .news_scheduler import start_news_scheduler
-from .multi_sms import start_multi_sms_worker
-from .security import add_security_headers
+# Flask, the Twilio SDK and OpenAI are imported inside create_app(): importing
+# a submodule such as ``app.faiss_service`` from scripts or the CLI must not
+# pay for the whole web stack (blueprints, workers, SDK clients).
 
 
 def _should_start_workers(app_settings) -> bool:
@@ -53,7 +47,26 @@ def create_app() -> Flask:
     Raises:
         RuntimeError: If required environment variables are missing
     """
+    from flask import Flask
+
+    from .chat_logic import build_chat_engine
+    from .config import get_settings
+    from .json_provider import OrjsonProvider
+    from .twilio_client import TwilioService
+    from .webhooks import webhooks_bp, init_runtime
+    from .logger import configure_logging
+    from .database import init_app as init_database, apply_ai_env_defaults
+    from .ui import ui_bp
+    from .auto_reply import start_auto_reply_worker
+    from .reminder import start_reminder_worker
+    from .news_scheduler import start_news_scheduler
+    from .multi_sms import start_multi_sms_worker
+    from .persistence_queue import start_persistence_worker
+    from .security import LimitedFormRequest, add_security_headers
+
     app = Flask(__name__)
+    app.request_class = LimitedFormRequest
+    app.json = OrjsonProvider(app)  # orjson-backed jsonify when available
 
     # Configure logging first for early error visibility
     configure_logging(app)
@@ -68,6 +81,10 @@ def create_app() -> Flask:
     twilio_client = TwilioService(twilio_settings)
     app.config["TWILIO_CLIENT"] = twilio_client
 
+    # Chat engine for fallback auto-replies; built once, rebuilt on settings reload
+    app.config["CHAT_ENGINE"] = build_chat_engine()
+    init_runtime(app)
+
     # Initialize database and apply environment defaults
     init_database(app)
     apply_ai_env_defaults(app)
@@ -79,9 +96,11 @@ def create_app() -> Flask:
     # Start background workers for automated tasks (only in the main process)
     if _should_start_workers(app_settings):
         start_auto_reply_worker(app)  # Auto-reply on inbound SMS
+        start_auto_reply_worker(app, lane="news")  # /news answers (slow FAISS + LLM)
         start_reminder_worker(app)     # Scheduled reminders
         start_news_scheduler(app)      # News notifications
         start_multi_sms_worker(app)    # Batch SMS sending
+        start_persistence_worker(app)  # Write-behind message persistence
     else:
         app.logger.info("Skipping background workers in reloader bootstrap process")
 
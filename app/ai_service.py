@@ -7,6 +7,7 @@ SMS responses using chat history and configurable prompts.
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from typing import List, Dict, Optional, Any
 
@@ -20,6 +21,18 @@ from .exceptions import AIServiceError, ConfigurationError
 from .message_utils import MAX_SMS_CHARS, split_sms_chunks
 
 
+@functools.lru_cache(maxsize=8)
+def get_openai_client(api_key: str) -> OpenAI:
+    """
+    Return a shared OpenAI client for ``api_key``.
+
+    Clients are thread-safe and keep an HTTP connection pool, so reusing
+    one avoids a new TLS handshake with the API on every reply. A changed
+    key simply gets its own client.
+    """
+    return OpenAI(api_key=api_key)
+
+
 @dataclass
 class AIResponder:
     """
@@ -34,6 +47,8 @@ class AIResponder:
         system_prompt: System message defining AI behavior
         temperature: Response randomness (0.0-2.0)
         history_limit: Max conversation messages to include
+        max_retries: Override the OpenAI SDK's own retry count (None keeps
+            the SDK default); set 0 when the caller retries itself
     """
 
     api_key: str
@@ -41,6 +56,7 @@ class AIResponder:
     system_prompt: str
     temperature: float
     history_limit: int = 20
+    max_retries: Optional[int] = None
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
@@ -139,7 +155,10 @@ class AIResponder:
             )
             return ""
 
-        client = OpenAI(api_key=self.api_key)
+        client = get_openai_client(self.api_key)
+        if self.max_retries is not None:
+            # Copy sharing the cached client's connection pool
+            client = client.with_options(max_retries=self.max_retries)
         
         try:
             response = client.chat.completions.create(
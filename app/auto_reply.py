@@ -20,6 +20,18 @@ ALLOWED_NUMBER_RE = re.compile(r"^\+[1-9]\d{6,14}$")
 
 _TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
 
+# Worker lanes (app.config keys for queue and thread). /news answers run a
+# FAISS search plus an LLM call, often for several seconds, so they get their
+# own queue and thread and never hold up ordinary AI/auto-replies.
+_LANE_CONFIG_KEYS = {
+    "default": ("AUTO_REPLY_QUEUE", "AUTO_REPLY_THREAD"),
+    "news": ("NEWS_REPLY_QUEUE", "NEWS_REPLY_THREAD"),
+}
+
+
+def _lane_for_body(body: Optional[str]) -> str:
+    return "news" if (body or "").strip().lower().startswith("/news") else "default"
+
 
 def _utc_now_iso() -> str:
     return datetime.utcnow().strftime(_TIMESTAMP_FORMAT)
@@ -34,7 +46,7 @@ def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
-def start_auto_reply_worker(app: Flask, force_restart: bool = False) -> None:
+def start_auto_reply_worker(app: Flask, force_restart: bool = False, lane: str = "default") -> None:
     """
     Start a daemon background worker for asynchronous message processing.
     
@@ -61,25 +73,30 @@ def start_auto_reply_worker(app: Flask, force_restart: bool = False) -> None:
     Args:
         app: Flask application instance (required for app context and config)
         force_restart: Force restart even if worker thread is alive
+        lane: Queue/thread pair to serve ("default" or "news"); every lane
+            runs the same processing, see ``_LANE_CONFIG_KEYS``
         
     Note:
         Worker death in debug mode (Werkzeug reloader) is expected due to
         process forking. The enqueue function handles automatic recovery.
     """
 
+    queue_key, thread_key = _LANE_CONFIG_KEYS[lane]
+
     # Check if worker is already running and alive
-    existing_thread = app.config.get("AUTO_REPLY_THREAD")
+    existing_thread = app.config.get(thread_key)
     if existing_thread and existing_thread.is_alive() and not force_restart:
-        app.logger.debug("Auto-reply worker already running and alive; skipping startup")
+        app.logger.debug("Auto-reply worker (%s) already running and alive; skipping startup", lane)
         return
 
     # Reset flag to allow restart
-    app.config["AUTO_REPLY_WORKER_STARTED"] = False
+    if lane == "default":
+        app.config["AUTO_REPLY_WORKER_STARTED"] = False
 
-    app.logger.info("Starting auto-reply worker thread (force_restart=%s)", force_restart)
+    app.logger.info("Starting auto-reply worker thread (lane=%s, force_restart=%s)", lane, force_restart)
 
     # CRITICAL: Always use the SAME queue instance from app.config
-    queue: SimpleQueue[InboundPayload] = app.config.setdefault("AUTO_REPLY_QUEUE", SimpleQueue())
+    queue: SimpleQueue[InboundPayload] = app.config.setdefault(queue_key, SimpleQueue())
     processed_sids: deque[str] = deque(maxlen=1000)  # simple dedupe within process lifetime
     
     app.logger.info("Auto-reply worker will listen on queue id=%s (app config id=%s)", id(queue), id(app.config))
@@ -426,10 +443,12 @@ def start_auto_reply_worker(app: Flask, force_restart: bool = False) -> None:
             except Exception as exc:  # noqa: BLE001
                 app.logger.exception("Auto-reply worker error: %s", exc)
 
-    thread = threading.Thread(target=worker, name="auto-reply-worker", daemon=True)
+    thread_name = "auto-reply-worker" if lane == "default" else f"{lane}-reply-worker"
+    thread = threading.Thread(target=worker, name=thread_name, daemon=True)
     thread.start()
-    app.config["AUTO_REPLY_THREAD"] = thread
-    app.config["AUTO_REPLY_WORKER_STARTED"] = True
+    app.config[thread_key] = thread
+    if lane == "default":
+        app.config["AUTO_REPLY_WORKER_STARTED"] = True
 
 
 def enqueue_auto_reply(
@@ -453,6 +472,10 @@ def enqueue_auto_reply(
         Automatically restarts the worker if it has died (common in debug mode
         with Werkzeug reloader due to process forking).
     
+    Lanes:
+        ``/news`` commands go to their own queue and worker thread so slow
+        news answers do not delay other replies.
+    
     Deduplication:
         While this function doesn't perform deduplication itself, the worker
         checks `has_outbound_reply_for_inbound()` to prevent duplicate responses.
@@ -474,10 +497,13 @@ def enqueue_auto_reply(
         ...     body="Hello from user",
         ... )
     """
+    lane = _lane_for_body(body)
+    queue_key, thread_key = _LANE_CONFIG_KEYS[lane]
+
     # CRITICAL: Always use the SAME queue instance from app.config
-    queue: SimpleQueue[InboundPayload] = app.config.setdefault("AUTO_REPLY_QUEUE", SimpleQueue())
+    queue: SimpleQueue[InboundPayload] = app.config.setdefault(queue_key, SimpleQueue())
     
-    thread = app.config.get("AUTO_REPLY_THREAD")
+    thread = app.config.get(thread_key)
     thread_alive = thread.is_alive() if thread else False
     
     app.logger.debug(
@@ -487,8 +513,8 @@ def enqueue_auto_reply(
     
     # Restart worker if it died
     if not thread_alive:
-        app.logger.warning("Auto-reply worker not running or died; restarting now")
-        start_auto_reply_worker(app, force_restart=True)
+        app.logger.warning("Auto-reply worker (%s) not running or died; restarting now", lane)
+        start_auto_reply_worker(app, force_restart=True, lane=lane)
 
     payload: InboundPayload = {
         "sid": sid,
@@ -245,6 +245,7 @@ def reload_runtime_settings(app) -> dict:
     are missing to avoid half-configured state.
     """
 
+    from .chat_logic import build_chat_engine
     from .twilio_client import TwilioService  # local import to avoid cycle
 
     app_settings, twilio_settings, openai_settings = get_settings()
@@ -252,6 +253,11 @@ def reload_runtime_settings(app) -> dict:
     app.config["TWILIO_SETTINGS"] = twilio_settings
     app.config["OPENAI_SETTINGS"] = openai_settings
     app.config["TWILIO_CLIENT"] = TwilioService(twilio_settings)
+    app.config["CHAT_ENGINE"] = build_chat_engine()  # CHAT_MODE may have changed
+
+    from .webhooks import init_runtime  # local import to avoid cycle
+
+    init_runtime(app)
 
     return {
         "app_env": app_settings.env,
@@ -3,21 +3,31 @@ from __future__ import annotations
 import functools
 import sqlite3
 import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 import os
-from typing import Any, Callable, Dict, Generator, List, Optional, Sequence, Set, Tuple, TypeVar
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Sequence, Set, Tuple, TypeVar
 
 from flask import current_app, g
 
+from .patterns import TTLCache
+
 # =============================================================================
 # Module Configuration
 # =============================================================================
 
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 13
 _SCHEMA_INIT_FLAG = "_SCHEMA_INITIALIZED"
+_WAL_INIT_FLAG = "_SQLITE_WAL_ENABLED"
+# SQLite has no connection pool: each request opens its own connection and
+# writers (webhooks, write-behind and auto-reply workers) take turns on the
+# single write lock. Wait this long for it instead of failing with
+# "database is locked" under webhook bursts.
+DB_BUSY_TIMEOUT = float(os.getenv("DB_BUSY_TIMEOUT", "15"))
 _TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+MESSAGE_DIRECTIONS = frozenset({"inbound", "outbound"})
 _NORMALIZE_PREFIXES = ("whatsapp:", "sms:", "mms:", "client:", "sip:")
 _NORMALIZE_STRIP_CHARS = (" ", "-", "(", ")", ".", "_")
 
@@ -149,13 +159,18 @@ def _get_connection() -> sqlite3.Connection:
             
             conn = sqlite3.connect(
                 db_path,
+                timeout=DB_BUSY_TIMEOUT,
                 check_same_thread=False,
                 isolation_level=None,  # Autocommit for better WAL performance
+                cached_statements=256,  # Keep hot INSERT/UPDATE statements prepared
             )
             conn.row_factory = sqlite3.Row
             
-            # Enable WAL mode for better concurrent read/write performance
-            conn.execute("PRAGMA journal_mode=WAL")
+            # Enable WAL mode for better concurrent read/write performance.
+            # The mode is stored in the database file, so set it once per process.
+            if not current_app.config.get(_WAL_INIT_FLAG):
+                conn.execute("PRAGMA journal_mode=WAL")
+                current_app.config[_WAL_INIT_FLAG] = True
             conn.execute("PRAGMA synchronous=NORMAL")
             conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
             conn.execute("PRAGMA temp_store=MEMORY")
@@ -272,11 +287,14 @@ def _create_base_schema(conn: sqlite3.Connection) -> None:
             updated_at TEXT NOT NULL
         );
 
-        CREATE INDEX IF NOT EXISTS idx_messages_sid ON messages(sid);
         CREATE INDEX IF NOT EXISTS idx_messages_created_at
             ON messages(created_at);
         CREATE INDEX IF NOT EXISTS idx_messages_direction_created_at
             ON messages(direction, created_at);
+        CREATE INDEX IF NOT EXISTS idx_messages_created_dt
+            ON messages(datetime(created_at), id);
+        CREATE INDEX IF NOT EXISTS idx_messages_direction_created_dt
+            ON messages(direction, datetime(created_at), id);
 
         CREATE TABLE IF NOT EXISTS auto_reply_config (
             id INTEGER PRIMARY KEY CHECK(id = 1),
@@ -300,6 +318,8 @@ def _create_base_schema(conn: sqlite3.Connection) -> None:
         );
         CREATE INDEX IF NOT EXISTS idx_scheduled_enabled_next_run
             ON scheduled_messages(enabled, next_run_at);
+        CREATE INDEX IF NOT EXISTS idx_scheduled_enabled_due
+            ON scheduled_messages(enabled, datetime(next_run_at), id);
 
         CREATE TABLE IF NOT EXISTS ai_config (
             id INTEGER PRIMARY KEY CHECK(id = 1),
@@ -352,6 +372,7 @@ def _create_base_schema(conn: sqlite3.Connection) -> None:
             ON multi_sms_recipients(batch_id, status);
         """
     )
+    _create_participant_indexes(conn)
 
 
 def _migration_add_auto_reply_enabled_since(conn: sqlite3.Connection) -> None:
@@ -371,6 +392,84 @@ def _migration_add_message_indexes(conn: sqlite3.Connection) -> None:
     )
 
 
+def _migration_add_message_sort_indexes(conn: sqlite3.Connection) -> None:
+    """
+    Index the ``datetime(created_at), id`` ordering used by message listings.
+
+    The plain ``created_at`` indexes cannot serve ``ORDER BY datetime(created_at)``,
+    so newest-first listings (optionally filtered by direction) sorted the
+    whole match set before applying LIMIT. With these expression indexes
+    SQLite walks the index in order and stops after ``limit`` rows.
+    """
+    conn.executescript(
+        """
+        CREATE INDEX IF NOT EXISTS idx_messages_created_dt
+            ON messages(datetime(created_at), id);
+        CREATE INDEX IF NOT EXISTS idx_messages_direction_created_dt
+            ON messages(direction, datetime(created_at), id);
+        """
+    )
+
+
+def _create_participant_indexes(conn: sqlite3.Connection) -> None:
+    """
+    Index the normalized ``to_number`` / ``from_number`` expressions.
+
+    Conversation views filter on ``_normalized_sql(...) = ?`` for either side,
+    which SQLite answers with a MULTI-INDEX OR over these two indexes instead
+    of scanning the whole ``datetime(created_at)`` index. The expressions must
+    stay byte-identical to :func:`_normalized_sql` for the planner to match.
+    """
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_messages_to_normalized ON messages(({_normalized_sql('to_number')}))"
+    )
+    conn.execute(
+        f"CREATE INDEX IF NOT EXISTS idx_messages_from_normalized ON messages(({_normalized_sql('from_number')}))"
+    )
+
+
+def _migration_index_normalized_participants(conn: sqlite3.Connection) -> None:
+    """
+    Replace the raw ``to_number`` / ``from_number`` sort indexes.
+
+    The conversation queries filter on normalized numbers, so the raw-column
+    indexes were never used there while every insert paid for them.
+    """
+    conn.execute("DROP INDEX IF EXISTS idx_messages_to_created_dt")
+    conn.execute("DROP INDEX IF EXISTS idx_messages_from_created_dt")
+    _create_participant_indexes(conn)
+
+
+def _migration_drop_duplicate_sid_index(conn: sqlite3.Connection) -> None:
+    """
+    Drop ``idx_messages_sid``, which duplicates the ``sid UNIQUE`` autoindex.
+
+    SID lookups, upserts and deletes already search the unique index, so the
+    extra B-tree only added work to every message write. Kept when the
+    unique constraint is missing so SID lookups never lose their index.
+    """
+    has_unique_sid = any(
+        row["unique"] and [col["name"] for col in conn.execute(f"PRAGMA index_info('{row['name']}')")] == ["sid"]
+        for row in conn.execute("PRAGMA index_list('messages')")
+    )
+    if has_unique_sid:
+        conn.execute("DROP INDEX IF EXISTS idx_messages_sid")
+
+
+def _migration_add_scheduled_due_index(conn: sqlite3.Connection) -> None:
+    """
+    Index reminders by ``datetime(next_run_at)`` for the scheduler's due query.
+
+    ``list_due_scheduled_messages`` filters and orders by the expression, so
+    ``idx_scheduled_enabled_next_run`` only narrowed by ``enabled`` and every
+    enabled reminder was sorted on each poll; this index seeks the due ones.
+    """
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_scheduled_enabled_due "
+        "ON scheduled_messages(enabled, datetime(next_run_at), id)"
+    )
+
+
 def _migration_add_ai_config(conn: sqlite3.Connection) -> None:
     conn.executescript(
         """
@@ -602,6 +701,22 @@ def _ensure_schema() -> None:
                 _migration_add_listeners_config(conn)
                 current_version = 9
 
+            if current_version < 10:
+                _migration_add_message_sort_indexes(conn)
+                current_version = 10
+
+            if current_version < 11:
+                _migration_drop_duplicate_sid_index(conn)
+                current_version = 11
+
+            if current_version < 12:
+                _migration_add_scheduled_due_index(conn)
+                current_version = 12
+
+            if current_version < 13:
+                _migration_index_normalized_participants(conn)
+                current_version = 13
+
         _ensure_multi_sms_tables(conn)
         _ensure_listeners_config_table(conn)
 
@@ -628,6 +743,74 @@ def _safe_fromiso(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
+# Rows per executemany() flush in upsert_messages_bulk (9 params per row).
+UPSERT_BATCH_SIZE = 200
+
+_MESSAGE_UPSERT_SQL = """
+    INSERT INTO messages (
+        sid,
+        direction,
+        to_number,
+        from_number,
+        body,
+        status,
+        error,
+        created_at,
+        updated_at
+    ) VALUES (
+        :sid, :direction, :to_number, :from_number, :body, :status, :error, :created_at, :updated_at
+    )
+    ON CONFLICT(sid) DO UPDATE SET
+        direction = excluded.direction,
+        to_number = excluded.to_number,
+        from_number = excluded.from_number,
+        body = excluded.body,
+        status = excluded.status,
+        error = excluded.error,
+        created_at = excluded.created_at,
+        updated_at = excluded.updated_at
+"""
+
+
+def _find_sid_placeholder(
+    conn: sqlite3.Connection,
+    *,
+    direction: str,
+    to_number: Optional[str],
+    from_number: Optional[str],
+    created_at: str,
+) -> Optional[int]:
+    """Return the id of a recent SID-less row that should adopt an incoming SID.
+
+    Messages stored before Twilio returned a SID (failed sends, inbound hooks
+    without ``MessageSid``) are claimed by the first matching upsert created
+    within 10 minutes of the placeholder.
+    """
+    placeholder = conn.execute(
+        """
+        SELECT id, created_at
+          FROM messages
+         WHERE sid IS NULL
+           AND direction = ?
+           AND ((from_number = ?) OR (from_number IS NULL AND ? IS NULL))
+           AND ((to_number = ?) OR (to_number IS NULL AND ? IS NULL))
+      ORDER BY datetime(created_at) DESC, id DESC
+         LIMIT 1
+        """,
+        (direction, from_number, from_number, to_number, to_number),
+    ).fetchone()
+
+    if not placeholder:
+        return None
+
+    placeholder_dt = _safe_fromiso(placeholder["created_at"])
+    desired_dt = _safe_fromiso(created_at)
+    if placeholder_dt and desired_dt:
+        if abs((desired_dt - placeholder_dt).total_seconds()) > 600:
+            return None
+    return int(placeholder["id"])
+
+
 def upsert_message(
     *,
     sid: Optional[str],
@@ -699,31 +882,19 @@ def upsert_message(
 
         conn.execute(query, params)
         conn.commit()
+        _invalidate_message_stats()
         return record_id
 
     if sid:
-        placeholder = conn.execute(
-            """
-            SELECT id, created_at
-              FROM messages
-             WHERE sid IS NULL
-               AND direction = ?
-               AND ((from_number = ?) OR (from_number IS NULL AND ? IS NULL))
-               AND ((to_number = ?) OR (to_number IS NULL AND ? IS NULL))
-          ORDER BY datetime(created_at) DESC, id DESC
-             LIMIT 1
-            """,
-            (direction, from_number, from_number, to_number, to_number),
-        ).fetchone()
-
-        if placeholder:
-            placeholder_dt = _safe_fromiso(placeholder["created_at"])
-            desired_dt = _safe_fromiso(created_value)
-            use_placeholder = True
-            if placeholder_dt and desired_dt:
-                use_placeholder = abs((desired_dt - placeholder_dt).total_seconds()) <= 600
-            if use_placeholder:
-                return _update_record(int(placeholder["id"]), set_sid=True)
+        placeholder_id = _find_sid_placeholder(
+            conn,
+            direction=direction,
+            to_number=to_number,
+            from_number=from_number,
+            created_at=created_value,
+        )
+        if placeholder_id is not None:
+            return _update_record(placeholder_id, set_sid=True)
 
         try:
             cursor = conn.execute(
@@ -743,6 +914,7 @@ def upsert_message(
                 (sid, direction, to_number, from_number, body, status, error, created_value, updated_value),
             )
             conn.commit()
+            _invalidate_message_stats()
             return _get_lastrowid(cursor)
         except sqlite3.IntegrityError:
             existing = conn.execute(
@@ -770,9 +942,92 @@ def upsert_message(
         (sid, direction, to_number, from_number, body, status, error, created_value, updated_value),
     )
     conn.commit()
+    _invalidate_message_stats()
     return _get_lastrowid(cursor)
 
 
+def upsert_messages_bulk(
+    rows: Iterable[Dict[str, Any]],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> int:
+    """
+    Upsert many message snapshots in a single transaction.
+
+    Each row carries the keyword arguments of :func:`upsert_message`. Rows
+    that adopt a SID-less placeholder are updated in place; the rest go
+    through ``executemany`` of ``INSERT ... ON CONFLICT(sid) DO UPDATE`` in
+    chunks of ``batch_size`` and a single commit, instead of one commit per
+    message. ``rows`` may be a generator; only one chunk is held at a time.
+
+    Args:
+        rows: Message dicts with ``sid``, ``direction``, ``to_number``,
+            ``from_number``, ``body``, ``status``, ``error`` and optional
+            ``created_at`` / ``updated_at``
+        batch_size: Rows per ``executemany`` call
+
+    Returns:
+        Number of rows written
+    """
+    now = _utc_timestamp()
+    pending: List[Dict[str, Any]] = []
+    written = 0
+
+    with transaction() as conn:
+        for row in rows:
+            written += 1
+            params = {
+                "sid": row.get("sid"),
+                "direction": row["direction"],
+                "to_number": row.get("to_number"),
+                "from_number": row.get("from_number"),
+                "body": row.get("body") or "",
+                "status": row.get("status"),
+                "error": row.get("error"),
+                "created_at": row.get("created_at") or now,
+                "updated_at": row.get("updated_at") or now,
+            }
+            if params["sid"]:
+                placeholder_id = _find_sid_placeholder(
+                    conn,
+                    direction=params["direction"],
+                    to_number=params["to_number"],
+                    from_number=params["from_number"],
+                    created_at=params["created_at"],
+                )
+                if placeholder_id is not None:
+                    try:
+                        conn.execute(
+                            """
+                            UPDATE messages
+                               SET sid = :sid,
+                                   direction = :direction,
+                                   to_number = :to_number,
+                                   from_number = :from_number,
+                                   body = :body,
+                                   status = :status,
+                                   error = :error,
+                                   created_at = :created_at,
+                                   updated_at = :updated_at
+                             WHERE id = :id
+                            """,
+                            {**params, "id": placeholder_id},
+                        )
+                        continue
+                    except sqlite3.IntegrityError:
+                        # SID already stored on another row; upsert that one instead.
+                        pass
+            pending.append(params)
+            if len(pending) >= batch_size:
+                conn.executemany(_MESSAGE_UPSERT_SQL, pending)
+                pending.clear()
+
+        if pending:
+            conn.executemany(_MESSAGE_UPSERT_SQL, pending)
+
+    _invalidate_message_stats()
+    return written
+
+
 def insert_message(
     *,
     direction: str,
@@ -806,28 +1061,63 @@ def insert_message(
         (sid, direction, to_number, from_number, body, status, error, created_value, updated_value),
     )
     conn.commit()
+    _invalidate_message_stats()
     return _get_lastrowid(cursor)
 
 
+# Shared by the single and bulk status paths so both hit the same entry in
+# the connection's prepared-statement cache.
+_STATUS_UPDATE_SQL = """
+    UPDATE messages
+       SET status = :status,
+           error = CASE WHEN :error IS NOT NULL THEN :error ELSE error END,
+           updated_at = :updated_at
+     WHERE sid = :sid
+"""
+
+
 def update_message_status_by_sid(
     *, sid: str, status: Optional[str], error: Optional[str] = None
 ) -> bool:
     conn = _get_connection()
-    now = _utc_timestamp()
     cursor = conn.execute(
-        """
-        UPDATE messages
-           SET status = ?,
-               error = CASE WHEN ? IS NOT NULL THEN ? ELSE error END,
-               updated_at = ?
-         WHERE sid = ?
-        """,
-        (status, error, error, now, sid),
+        _STATUS_UPDATE_SQL,
+        {"status": status, "error": error, "updated_at": _utc_timestamp(), "sid": sid},
     )
     conn.commit()
+    _invalidate_message_stats()
     return cursor.rowcount > 0
 
 
+def update_message_statuses_bulk(
+    updates: Sequence[Tuple[str, Optional[str], Optional[str]]],
+) -> int:
+    """
+    Apply many status updates in a single transaction.
+
+    Args:
+        updates: ``(sid, status, error)`` tuples; a None error keeps the
+            stored one, as in :func:`update_message_status_by_sid`
+
+    Returns:
+        Number of rows updated (unknown SIDs are skipped)
+    """
+    if not updates:
+        return 0
+
+    now = _utc_timestamp()
+    with transaction() as conn:
+        cursor = conn.executemany(
+            _STATUS_UPDATE_SQL,
+            [
+                {"status": status, "error": error, "updated_at": now, "sid": sid}
+                for sid, status, error in updates
+            ],
+        )
+    _invalidate_message_stats()
+    return cursor.rowcount
+
+
 def has_outbound_reply_for_inbound(inbound_sid: str, to_number: str) -> bool:
     """
     Check if an outbound reply was already sent for a specific inbound message.
@@ -891,17 +1181,23 @@ def has_outbound_reply_for_inbound(inbound_sid: str, to_number: str) -> bool:
     return outbound_row is not None
 
 
-def list_messages(
-    limit: int = 50,
-    direction: Optional[str] = None,
-    participant: Optional[str] = None,
-    participant_normalized: Optional[str] = None,
-    ascending: bool = False,
-) -> List[Dict[str, Any]]:
+def _messages_query(
+    limit: int,
+    direction: Optional[str],
+    participant: Optional[str],
+    participant_normalized: Optional[str],
+    before: Optional[Tuple[str, int]] = None,
+) -> Optional[Tuple[str, List[Any]]]:
+    """
+    Build the newest-first messages query; None when the filter matches nothing.
+
+    ``before`` is a ``(created_at, id)`` keyset cursor: only rows ordered
+    after it (older) are returned, so paging seeks the
+    ``datetime(created_at), id`` indexes instead of skipping an OFFSET.
+    """
     if participant and participant_normalized:
         raise ValueError("Provide either participant or participant_normalized, not both")
 
-    conn = _get_connection()
     query = (
         "SELECT id, sid, direction, to_number, from_number, body, status, error, created_at, updated_at "
         "FROM messages"
@@ -909,7 +1205,7 @@ def list_messages(
     params: List[Any] = []
     clauses = []
 
-    if direction in {"inbound", "outbound"}:
+    if direction in MESSAGE_DIRECTIONS:
         clauses.append("direction = ?")
         params.append(direction)
 
@@ -919,20 +1215,82 @@ def list_messages(
     elif participant_normalized:
         normalized_value = normalize_contact(participant_normalized)
         if not normalized_value:
-            return []
+            return None
         normalized_to = _normalized_sql("to_number")
         normalized_from = _normalized_sql("from_number")
         clauses.append(f"(({normalized_to}) = ? OR ({normalized_from}) = ?)")
         params.extend([normalized_value, normalized_value])
 
+    if before is not None:
+        # Spelled out instead of a row-value comparison so SQLite can range-seek the index
+        clauses.append(
+            "datetime(created_at) <= datetime(?) AND (datetime(created_at) < datetime(?) OR id < ?)"
+        )
+        params.extend([before[0], before[0], before[1]])
+
     if clauses:
         query += " WHERE " + " AND ".join(clauses)
 
     query += " ORDER BY datetime(created_at) DESC, id DESC LIMIT ?"
     params.append(limit)
+    return query, params
 
-    rows = conn.execute(query, params).fetchall()
-    items = [_row_to_dict(row) for row in rows]
+
+def iter_messages(
+    limit: int = 50,
+    direction: Optional[str] = None,
+    participant: Optional[str] = None,
+    participant_normalized: Optional[str] = None,
+    batch_size: int = 100,
+    before: Optional[Tuple[str, int]] = None,
+) -> Generator[Dict[str, Any], None, None]:
+    """
+    Yield messages newest-first, fetching rows from the cursor in batches.
+
+    Filters match :func:`list_messages`. Only ``batch_size`` rows are held in
+    memory at a time, which lets large listings be streamed to the client.
+    Filter validation happens eagerly, before the first row is requested.
+    """
+    built = _messages_query(limit, direction, participant, participant_normalized, before)
+    return _iter_query_rows(built, batch_size)
+
+
+def _iter_query_rows(
+    built: Optional[Tuple[str, List[Any]]],
+    batch_size: int,
+) -> Generator[Dict[str, Any], None, None]:
+    if built is None:
+        return
+    query, params = built
+    cursor = _get_connection().execute(query, params)
+    try:
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield _row_to_dict(row)
+    finally:
+        cursor.close()
+
+
+def list_messages(
+    limit: int = 50,
+    direction: Optional[str] = None,
+    participant: Optional[str] = None,
+    participant_normalized: Optional[str] = None,
+    ascending: bool = False,
+    before: Optional[Tuple[str, int]] = None,
+) -> List[Dict[str, Any]]:
+    items = list(
+        iter_messages(
+            limit=limit,
+            direction=direction,
+            participant=participant,
+            participant_normalized=participant_normalized,
+            before=before,
+        )
+    )
     if ascending:
         items.reverse()
     return items
@@ -980,6 +1338,7 @@ def delete_conversation_messages(
     conn = _get_connection()
     cursor = conn.execute(f"DELETE FROM messages WHERE {clause}", params)
     conn.commit()
+    _invalidate_message_stats()
     return cursor.rowcount
 
 
@@ -1055,7 +1414,28 @@ def list_inbound_after(last_id: int, limit: int = 50) -> List[Dict[str, Any]]:
     return [_row_to_dict(row) for row in rows]
 
 
+# Inbound webhooks and the auto-reply worker read both config rows on every
+# message; the setters clear this cache, so the TTL only bounds staleness
+# from writes made by other processes.
+CONFIG_CACHE_TTL = 2.0
+_config_cache: TTLCache[Dict[str, Any]] = TTLCache(ttl=CONFIG_CACHE_TTL, max_size=16)
+
+
+def _cached_config(kind: str, loader: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    cache_key = f"{kind}:{current_app.config['APP_SETTINGS'].db_path}"
+    cfg = _config_cache.get(cache_key)
+    if cfg is None:
+        cfg = loader()
+        _config_cache.set(cache_key, cfg)
+    return dict(cfg)
+
+
 def get_auto_reply_config() -> Dict[str, Any]:
+    """Return the auto-reply configuration (cached for ``CONFIG_CACHE_TTL`` seconds)."""
+    return _cached_config("auto_reply", _load_auto_reply_config)
+
+
+def _load_auto_reply_config() -> Dict[str, Any]:
     conn = _get_connection()
     row = conn.execute(
         "SELECT id, enabled, message, enabled_since FROM auto_reply_config WHERE id = 1"
@@ -1096,9 +1476,30 @@ def set_auto_reply_config(*, enabled: bool, message: str) -> None:
         (1 if enabled else 0, message or "", enabled_since),
     )
     conn.commit()
+    _config_cache.clear()
+
+
+# Dashboards poll /api/messages/stats every few seconds; every message write
+# clears this cache, so the TTL only bounds staleness from other processes.
+MESSAGE_STATS_TTL = 5.0
+_message_stats_cache: TTLCache[Dict[str, Any]] = TTLCache(ttl=MESSAGE_STATS_TTL, max_size=8)
+
+
+def _invalidate_message_stats() -> None:
+    _message_stats_cache.clear()
 
 
 def get_message_stats() -> Dict[str, Any]:
+    """Return message counts and the latest message, cached per database for a few seconds."""
+    cache_key = str(current_app.config["APP_SETTINGS"].db_path)
+    stats = _message_stats_cache.get(cache_key)
+    if stats is None:
+        stats = _compute_message_stats()
+        _message_stats_cache.set(cache_key, stats)
+    return dict(stats)
+
+
+def _compute_message_stats() -> Dict[str, Any]:
     conn = _get_connection()
 
     counts = conn.execute(
@@ -1133,6 +1534,11 @@ def get_message_stats() -> Dict[str, Any]:
 
 
 def get_ai_config() -> Dict[str, Any]:
+    """Return the AI configuration (cached for ``CONFIG_CACHE_TTL`` seconds)."""
+    return _cached_config("ai", _load_ai_config)
+
+
+def _load_ai_config() -> Dict[str, Any]:
     conn = _get_connection()
     row = conn.execute(
         """
@@ -1228,6 +1634,7 @@ def set_ai_config(
         ),
     )
     conn.commit()
+    _config_cache.clear()
     return get_ai_config()
 
 
@@ -1340,6 +1747,36 @@ def delete_app_setting(*, key: str, source: str = "db", user_ip: Optional[str] =
     return True
 
 
+def try_acquire_lease(key: str, ttl_seconds: float) -> bool:
+    """
+    Take a cross-process lease stored in ``app_settings`` (like ``SET NX EX``).
+
+    The row's value holds the expiry as epoch seconds; a single conditional
+    upsert claims the key only when it is missing or expired, so of several
+    gunicorn workers racing for the same key exactly one wins per
+    ``ttl_seconds``. Leases are not audited and are never released early.
+
+    Returns:
+        True when this caller now holds the lease
+    """
+    conn = _get_connection()
+    _ensure_app_settings_table(conn)
+    now = time.time()
+    cursor = conn.execute(
+        """
+        INSERT INTO app_settings (key, value, source, updated_at)
+        VALUES (?, ?, 'lease', ?)
+        ON CONFLICT(key)
+        DO UPDATE SET value = excluded.value,
+                      updated_at = excluded.updated_at
+                WHERE CAST(app_settings.value AS REAL) <= ?
+        """,
+        (key, repr(now + ttl_seconds), _utc_timestamp(), now),
+    )
+    conn.commit()
+    return cursor.rowcount > 0
+
+
 def _row_to_dict(row: Optional[sqlite3.Row]) -> Dict[str, Any]:
     if row is None:
         return {}
@@ -1350,13 +1787,34 @@ def delete_message_by_sid(sid: str) -> bool:
     conn = _get_connection()
     cursor = conn.execute("DELETE FROM messages WHERE sid = ?", (sid,))
     conn.commit()
+    _invalidate_message_stats()
     return cursor.rowcount > 0
 
 
 # Scheduled messages (reminders)
 
 
+# The dashboard polls /api/reminders; every reminder write in this process
+# clears the cache, so the TTL only bounds staleness from other processes.
+SCHEDULED_LIST_TTL = 5.0
+_scheduled_list_cache: TTLCache[List[Dict[str, Any]]] = TTLCache(ttl=SCHEDULED_LIST_TTL, max_size=8)
+
+
+def _invalidate_scheduled_list() -> None:
+    _scheduled_list_cache.clear()
+
+
 def list_scheduled_messages() -> List[Dict[str, Any]]:
+    """Return all reminders, newest first (cached per database for a few seconds)."""
+    cache_key = str(current_app.config["APP_SETTINGS"].db_path)
+    items = _scheduled_list_cache.get(cache_key)
+    if items is None:
+        items = _load_scheduled_messages()
+        _scheduled_list_cache.set(cache_key, items)
+    return [dict(item) for item in items]
+
+
+def _load_scheduled_messages() -> List[Dict[str, Any]]:
     conn = _get_connection()
     rows = conn.execute(
         """
@@ -1368,6 +1826,20 @@ def list_scheduled_messages() -> List[Dict[str, Any]]:
     return [_row_to_dict(row) for row in rows]
 
 
+def get_scheduled_message(sched_id: int) -> Optional[Dict[str, Any]]:
+    """Return a single reminder by id, or None when it does not exist."""
+    conn = _get_connection()
+    row = conn.execute(
+        """
+        SELECT id, to_number, body, interval_seconds, enabled, last_sent_at, next_run_at, created_at, updated_at
+          FROM scheduled_messages
+         WHERE id = ?
+        """,
+        (sched_id,),
+    ).fetchone()
+    return _row_to_dict(row) if row else None
+
+
 def create_scheduled_message(*, to_number: str, body: str, interval_seconds: int, enabled: bool = True) -> int:
     conn = _get_connection()
     now = _utc_timestamp()
@@ -1380,6 +1852,7 @@ def create_scheduled_message(*, to_number: str, body: str, interval_seconds: int
         (to_number, body, interval_seconds, 1 if enabled else 0, next_run, now, now),
     )
     conn.commit()
+    _invalidate_scheduled_list()
     return _get_lastrowid(cursor)
 
 
@@ -1420,6 +1893,7 @@ def update_scheduled_message(
         params,
     )
     conn.commit()
+    _invalidate_scheduled_list()
     return cursor.rowcount > 0
 
 
@@ -1427,6 +1901,7 @@ def delete_scheduled_message(sched_id: int) -> bool:
     conn = _get_connection()
     cursor = conn.execute("DELETE FROM scheduled_messages WHERE id = ?", (sched_id,))
     conn.commit()
+    _invalidate_scheduled_list()
     return cursor.rowcount > 0
 
 
@@ -1445,6 +1920,7 @@ def mark_scheduled_sent(sched_id: int, interval_seconds: int) -> None:
         (now, next_run, now, sched_id),
     )
     conn.commit()
+    _invalidate_scheduled_list()
 
 
 def list_due_scheduled_messages(limit: int = 20) -> List[Dict[str, Any]]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import json
 import logging
@@ -14,6 +15,8 @@ from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 
+from .json_utils import dumps as dumps_json, loads as loads_json, orjson
+
 try:
     import openai
 except Exception:  # pragma: no cover
@@ -193,6 +196,17 @@ class EmbeddingCache:
 _embedding_cache = EmbeddingCache()
 
 
+@functools.lru_cache(maxsize=4)
+def _openai_client(api_key: str):
+    """
+    Shared OpenAI client per key.
+
+    Embeddings, chat answers and every reloaded index reuse one client and
+    so one keep-alive connection pool instead of opening their own.
+    """
+    return openai.OpenAI(api_key=api_key)
+
+
 # =============================================================================
 # Embeddings adapter (batched with caching)
 # =============================================================================
@@ -220,7 +234,7 @@ class OpenAIEmbeddings(Embeddings):
                 "Ustaw go w .env zanim zbudujesz indeks FAISS."
             )
 
-        self.client = openai.OpenAI(api_key=self.api_key)
+        self.client = _openai_client(self.api_key)
 
     def embed_query(self, text: str) -> List[float]:
         """Embed single query with cache support."""
@@ -275,10 +289,10 @@ class OpenAIEmbeddings(Embeddings):
                 batch_embeddings.extend([item.embedding for item in resp.data])
             
             # Fill in uncached results and update cache
-            for idx, embedding in zip(uncached_indices, batch_embeddings):
+            for idx, text, embedding in zip(uncached_indices, uncached_texts, batch_embeddings):
                 out[idx] = embedding
                 if self.use_cache:
-                    _embedding_cache.set(uncached_texts[uncached_indices.index(idx)], self.model, embedding)
+                    _embedding_cache.set(text, self.model, embedding)
 
         return out
 
@@ -298,7 +312,7 @@ def read_articles_jsonl(path: str = ARTICLES_JSONL_PATH) -> List[Dict]:
                 line = line.strip()
                 if not line:
                     continue
-                rec = json.loads(line)
+                rec = loads_json(line)
                 if not isinstance(rec, dict):
                     continue
                 if not rec.get("url") or not rec.get("text"):
@@ -469,11 +483,15 @@ def _write_documents_snapshot(documents: List[Document], ids: List[str]) -> None
                     "chunk_hash": md.get("chunk_hash", ""),
                     "chunk_len": md.get("chunk_len", 0),
                 }
-                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+                f.write(dumps_json(rec) + "\n")
 
         legacy = [{"id": _id, "page_content": d.page_content, "metadata": d.metadata} for _id, d in zip(ids, documents)]
-        with open(DOCS_JSON_PATH, "w", encoding="utf-8") as f2:
-            json.dump(legacy, f2, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            with open(DOCS_JSON_PATH, "wb") as f2:
+                f2.write(orjson.dumps(legacy, option=orjson.OPT_INDENT_2))
+        else:
+            with open(DOCS_JSON_PATH, "w", encoding="utf-8") as f2:
+                json.dump(legacy, f2, ensure_ascii=False, indent=2)
 
     except Exception as exc:  # noqa: BLE001
         logging.warning("Cannot write documents snapshot: %s", exc)
@@ -683,7 +701,7 @@ class FAISSService:
         self.api_key = _get_openai_key()
         if openai and self.api_key:
             try:
-                self.client = openai.OpenAI(api_key=self.api_key)
+                self.client = _openai_client(self.api_key)
             except Exception:  # pragma: no cover
                 self.client = None
         else:
@@ -0,0 +1,63 @@
+"""
+Flask JSON provider backed by ``orjson``.
+
+Kept apart from :mod:`app.json_utils` so that importing the plain JSON
+helpers never pulls in Flask.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+from .json_utils import orjson
+
+# Datetimes and dataclasses go through Flask's ``default`` hook so orjson
+# output matches the stdlib provider (HTTP dates, asdict()).
+_PROVIDER_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that serializes with ``orjson`` when it is installed.
+
+    Installed in the app factory so every ``jsonify`` benefits. Pretty
+    printing (debug mode, ``compact=False``), custom dump/load arguments and
+    values orjson rejects (e.g. integers beyond 64 bits) fall back to the
+    stdlib-based default provider.
+    """
+
+    def _orjson_dumps(self, obj: Any, extra_options: int = 0) -> bytes:
+        options = _PROVIDER_OPTIONS | extra_options
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default, option=options)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if orjson is None or set(kwargs) - {"separators"}:
+            return super().dumps(obj, **kwargs)
+        try:
+            return self._orjson_dumps(obj).decode("utf-8")
+        except orjson.JSONEncodeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        if orjson is None or self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = self._orjson_dumps(obj, orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -0,0 +1,53 @@
+"""
+JSON serialization helpers for hot API paths.
+
+Uses ``orjson`` when it is installed and falls back to the standard library
+otherwise, so the optional dependency only changes speed, not behaviour.
+This module does not import Flask, so the Twilio client and scripts can use
+it outside the app; the ``jsonify`` provider lives in :mod:`app.json_provider`.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:  # optional dependency
+    import orjson
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps_bytes(value: Any) -> bytes:
+    """
+    Serialize ``value`` to compact UTF-8 JSON bytes.
+
+    Args:
+        value: JSON-compatible object (dict keys must be strings)
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps(value: Any) -> str:
+    """Serialize ``value`` to a compact JSON string (see :func:`dumps_bytes`)."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON (both backends raise a
+            ``ValueError`` subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -5,7 +5,10 @@ Provides structured logging with request context, IP resolution,
 and proper formatting for both development and production environments.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 from typing import Optional
 from flask import Flask, request, has_request_context
 
@@ -16,6 +19,7 @@ def configure_logging(app: Flask) -> None:
     
     Sets up:
     - Consistent log formatting across all loggers
+    - Queue-based handler dispatch (records written by a background thread)
     - Request logging middleware
     - Client IP resolution (proxy-aware)
     - Different log levels for dev vs production
@@ -43,9 +47,21 @@ def configure_logging(app: Flask) -> None:
     else:
         root_logger.setLevel(logging.INFO)
     
-    # Add handler if not already present (avoid duplicates)
-    if not any(isinstance(h, logging.StreamHandler) for h in root_logger.handlers):
-        root_logger.addHandler(handler)
+    # Handlers do their (blocking) I/O on a listener thread; request threads
+    # only enqueue records. Skip when an earlier app instance already did this.
+    if not any(isinstance(h, logging.handlers.QueueHandler) for h in root_logger.handlers):
+        targets = list(root_logger.handlers)
+        # Add handler if not already present (avoid duplicates)
+        if not any(isinstance(h, logging.StreamHandler) for h in targets):
+            targets.append(handler)
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        listener = logging.handlers.QueueListener(log_queue, *targets, respect_handler_level=True)
+        for target in targets:
+            root_logger.removeHandler(target)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        listener.start()
+        atexit.register(listener.stop)  # flush queued records on shutdown
+        app.config["LOG_QUEUE_LISTENER"] = listener
     
     # Suppress verbose third-party loggers in production
     if app_settings and not app_settings.debug:
@@ -0,0 +1,245 @@
+"""
+Write-behind persistence for message rows and status updates.
+
+Webhooks and endpoints that do not need to read their writes back hand them
+to a bounded in-memory queue drained by a daemon thread. The worker collects
+up to ``WRITE_BEHIND_BATCH_SIZE`` rows or waits ``WRITE_BEHIND_FLUSH_INTERVAL``
+seconds after the first one, then writes the batch via
+``upsert_messages_bulk`` / ``update_message_statuses_bulk`` so the HTTP
+response does not wait for SQLite commits.
+
+Queued items keep their grouping: rows enqueued together (e.g. an inbound
+message and its reply) are written in the same transaction.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from queue import Queue, Empty, Full
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from flask import Flask
+
+from .database import update_message_statuses_bulk, upsert_messages_bulk
+
+# Type alias for queued message rows (kwargs of upsert_message)
+MessageRow = Dict[str, Any]
+# (sid, status, error) as accepted by update_message_statuses_bulk
+StatusUpdate = Tuple[str, Optional[str], Optional[str]]
+# Queue items: ("rows", [MessageRow, ...]) or ("status", [StatusUpdate, ...])
+PersistenceItem = Tuple[str, List[Any]]
+
+WRITE_BEHIND_MAXSIZE = 10_000
+WRITE_BEHIND_BATCH_SIZE = 500
+WRITE_BEHIND_FLUSH_INTERVAL = 0.05  # seconds
+WRITE_BEHIND_SHUTDOWN_TIMEOUT = 5.0  # seconds to let an in-flight batch finish at exit
+
+
+def _take_batch(
+    queue: Queue[PersistenceItem],
+    first: PersistenceItem,
+) -> Tuple[List[MessageRow], List[StatusUpdate], int]:
+    """Collect ``first`` plus whatever arrives within the flush window, up to one batch."""
+    rows: List[MessageRow] = []
+    updates: List[StatusUpdate] = []
+    item: Optional[PersistenceItem] = first
+    deadline = time.monotonic() + WRITE_BEHIND_FLUSH_INTERVAL
+    taken = 0
+    while item is not None:
+        taken += 1
+        kind, entries = item
+        (rows if kind == "rows" else updates).extend(entries)
+        if len(rows) + len(updates) >= WRITE_BEHIND_BATCH_SIZE:
+            break
+        remaining = deadline - time.monotonic()
+        try:
+            item = queue.get(timeout=remaining) if remaining > 0 else queue.get_nowait()
+        except Empty:
+            item = None
+    return rows, updates, taken
+
+
+def _write_batch(
+    app: Flask,
+    queue: Queue[PersistenceItem],
+    rows: List[MessageRow],
+    updates: List[StatusUpdate],
+    taken: int,
+) -> None:
+    try:
+        with app.app_context():
+            if rows:
+                upsert_messages_bulk(rows)
+            if updates:
+                updated = update_message_statuses_bulk(updates)
+                if updated < len(updates):
+                    app.logger.warning(
+                        "Persistence worker: %s of %s status updates matched no stored message",
+                        len(updates) - updated,
+                        len(updates),
+                    )
+    finally:
+        for _ in range(taken):
+            queue.task_done()
+    app.logger.debug(
+        "Persistence worker flushed %s message rows and %s status updates",
+        len(rows),
+        len(updates),
+    )
+
+
+def start_persistence_worker(app: Flask, force_restart: bool = False) -> None:
+    """
+    Start a daemon worker that flushes queued writes to the database.
+
+    The worker blocks on the queue, then keeps draining until it holds
+    ``WRITE_BEHIND_BATCH_SIZE`` entries or ``WRITE_BEHIND_FLUSH_INTERVAL``
+    has passed, and writes message rows and status updates in one
+    transaction each. Errors are logged and the worker keeps running.
+
+    Webhooks acknowledge Twilio before their rows are written, so an
+    ``atexit`` hook (:func:`stop_persistence_worker`) flushes whatever is
+    still queued when the process shuts down.
+
+    Args:
+        app: Flask application instance (required for app context and config)
+        force_restart: Force restart even if worker thread is alive
+    """
+    existing_thread = app.config.get("PERSISTENCE_THREAD")
+    if existing_thread and existing_thread.is_alive() and not force_restart:
+        app.logger.debug("Persistence worker already running; skipping startup")
+        return
+
+    queue: Queue[PersistenceItem] = app.config.setdefault(
+        "PERSISTENCE_QUEUE", Queue(maxsize=WRITE_BEHIND_MAXSIZE)
+    )
+    stop_event: threading.Event = app.config.setdefault("PERSISTENCE_STOP", threading.Event())
+
+    def worker() -> None:
+        app.logger.info("Persistence worker thread started")
+        while not stop_event.is_set():
+            try:
+                try:
+                    first = queue.get(timeout=1.0)
+                except Empty:
+                    continue
+                _write_batch(app, queue, *_take_batch(queue, first))
+            except Exception as exc:  # noqa: BLE001
+                app.logger.exception("Persistence worker error: %s", exc)
+
+    thread = threading.Thread(target=worker, name="persistence-worker", daemon=True)
+    thread.start()
+    app.config["PERSISTENCE_THREAD"] = thread
+
+    if not app.config.get("PERSISTENCE_ATEXIT"):
+        atexit.register(stop_persistence_worker, app)  # flush queued writes on shutdown
+        app.config["PERSISTENCE_ATEXIT"] = True
+
+
+def stop_persistence_worker(app: Flask, timeout: float = WRITE_BEHIND_SHUTDOWN_TIMEOUT) -> None:
+    """
+    Stop the worker and write every item still in the queue.
+
+    The worker finishes the batch it is writing (joined for at most
+    ``timeout`` seconds); anything left is then flushed from the calling
+    thread. Later enqueues return False, so callers write synchronously.
+    """
+    stop_event: Optional[threading.Event] = app.config.get("PERSISTENCE_STOP")
+    queue: Optional[Queue[PersistenceItem]] = app.config.get("PERSISTENCE_QUEUE")
+    if stop_event is None or queue is None:
+        return
+    stop_event.set()
+
+    thread = app.config.get("PERSISTENCE_THREAD")
+    if thread is not None and thread.is_alive():
+        thread.join(timeout)
+        if thread.is_alive():
+            app.logger.warning("Persistence worker did not stop within %.1fs; flushing the queue anyway", timeout)
+
+    drained = 0
+    while True:
+        try:
+            first = queue.get_nowait()
+        except Empty:
+            break
+        rows, updates, taken = _take_batch(queue, first)
+        try:
+            _write_batch(app, queue, rows, updates, taken)
+            drained += len(rows) + len(updates)
+        except Exception as exc:  # noqa: BLE001
+            app.logger.exception("Persistence shutdown flush failed: %s", exc)
+    if drained:
+        app.logger.info("Persistence worker flushed %s queued writes at shutdown", drained)
+
+
+def _enqueue(app: Flask, item: PersistenceItem) -> bool:
+    thread = app.config.get("PERSISTENCE_THREAD")
+    if thread is None:
+        return False
+    stop_event: Optional[threading.Event] = app.config.get("PERSISTENCE_STOP")
+    if stop_event is not None and stop_event.is_set():
+        # Shutting down: nothing would drain a late item
+        return False
+    if not thread.is_alive():
+        app.logger.warning("Persistence worker died; restarting now")
+        start_persistence_worker(app, force_restart=True)
+
+    queue: Queue[PersistenceItem] = app.config["PERSISTENCE_QUEUE"]
+    try:
+        queue.put_nowait(item)
+    except Full:
+        app.logger.warning("Persistence queue full; writing %s %s synchronously", len(item[1]), item[0])
+        return False
+    return True
+
+
+def enqueue_message_rows(app: Flask, rows: Sequence[MessageRow]) -> bool:
+    """
+    Queue message rows for write-behind persistence in one transaction.
+
+    Returns False when the rows were not queued (worker never started in
+    this process, or the queue is full); the caller should then write them
+    synchronously.
+    """
+    return _enqueue(app, ("rows", list(rows)))
+
+
+def enqueue_message_row(app: Flask, row: MessageRow) -> bool:
+    """Queue a single message row; see :func:`enqueue_message_rows`."""
+    return enqueue_message_rows(app, [row])
+
+
+def enqueue_status_update(
+    app: Flask, sid: str, status: Optional[str], error: Optional[str] = None
+) -> bool:
+    """
+    Queue a delivery status update for write-behind persistence.
+
+    Returns False when the update was not queued; the caller should then
+    apply it synchronously.
+    """
+    return enqueue_status_updates(app, [(sid, status, error)])
+
+
+def enqueue_status_updates(app: Flask, updates: Sequence[StatusUpdate]) -> bool:
+    """Queue several ``(sid, status, error)`` updates as one write."""
+    return _enqueue(app, ("status", list(updates)))
+
+
+def wait_for_pending_writes(app: Flask, timeout: float = 2.0) -> bool:
+    """
+    Block until every queued write has been flushed, or ``timeout`` passes.
+
+    Call before deleting rows locally so a queued snapshot of the same
+    message cannot re-create it afterwards.
+
+    Returns:
+        True when the queue is drained (or was never used), False on timeout
+    """
+    queue: Optional[Queue[PersistenceItem]] = app.config.get("PERSISTENCE_QUEUE")
+    if queue is None:
+        return True
+    with queue.all_tasks_done:
+        return queue.all_tasks_done.wait_for(lambda: not queue.unfinished_tasks, timeout)
@@ -60,6 +60,20 @@ class TwilioWebhookValidator:
         return bool(self.validator.validate(url, params, signature))
 
 
+class LimitedFormRequest(Request):
+    """
+    Request class with tighter multipart form limits than Werkzeug's defaults.
+
+    Twilio callbacks and panel forms carry a few dozen short fields; file
+    uploads (FAISS backups) are streamed and not counted against
+    ``max_form_memory_size``. URL-encoded bodies are bounded separately by the
+    webhook Content-Length check.
+    """
+
+    max_form_memory_size = 64 * 1024
+    max_form_parts = 200
+
+
 def add_security_headers(response):
     """
     Add security headers to Flask response.
@@ -575,7 +575,10 @@
     }
   };
 
+  let reminderItems = [];
+
   const renderReminders = (items = []) => {
+    reminderItems = items;
     if (!remindersTableBody) return;
 
     if (!items.length) {
@@ -616,6 +619,26 @@
     reminderCountBadge && (reminderCountBadge.textContent = String(items.length));
   };
 
+  // Mutations return only the changed reminder; patch the cached list instead of refetching it.
+  const applyReminderChange = (res) => {
+    if (res.items) {
+      renderReminders(res.items);
+      return;
+    }
+    if (res.deleted) {
+      renderReminders(reminderItems.filter((item) => String(item.id) !== String(res.id)));
+      return;
+    }
+    if (!res.item) {
+      loadReminders();
+      return;
+    }
+    const index = reminderItems.findIndex((item) => String(item.id) === String(res.item.id));
+    renderReminders(index === -1
+      ? [res.item, ...reminderItems]
+      : reminderItems.map((item, i) => (i === index ? res.item : item)));
+  };
+
   const renderRemindersSkeleton = () => {
     if (!remindersTableBody) return;
     const row = `
@@ -3030,7 +3053,7 @@
         method: 'POST',
         body: JSON.stringify({ to, body, interval_minutes: intervalMinutes })
       });
-      renderReminders(res.items || []);
+      applyReminderChange(res);
       reminderForm.reset();
       reminderForm.classList.remove('was-validated');
       showToast({ title: 'Zapisano', message: 'Przypomnienie dodane.', type: 'success' });
@@ -3150,7 +3173,7 @@
     try {
       if (action === 'delete') {
         const res = await fetchJSON(`/api/reminders/${id}`, { method: 'DELETE' });
-        renderReminders(res.items || []);
+        applyReminderChange(res);
         showToast({ title: 'Usunięto', message: 'Przypomnienie usunięte.', type: 'success' });
       }
 
@@ -3160,7 +3183,7 @@
           method: 'POST',
           body: JSON.stringify({ enabled: !isEnabled })
         });
-        renderReminders(res.items || []);
+        applyReminderChange(res);
         showToast({ title: 'Zapisano', message: !isEnabled ? 'Przypomnienie włączone.' : 'Przypomnienie wstrzymane.', type: 'success' });
       }
     } catch (error) {
@@ -8,20 +8,42 @@ with proper error handling and configuration management.
 from __future__ import annotations
 
 from dataclasses import dataclass
-import json
 import logging
+import os
 from typing import Optional, Dict, Any, List
 
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
 
 from .config import TwilioSettings
 from .exceptions import TwilioAPIError, ConfigurationError
+from .json_utils import dumps as dumps_json
 from .message_utils import MAX_SMS_CHARS, split_sms_chunks
 
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_HTTP_TIMEOUT = 30.0
+
+
+def _http_timeout_from_env() -> float:
+    """Read ``TWILIO_HTTP_TIMEOUT``; malformed or non-positive values fall back to the default."""
+    raw = os.getenv("TWILIO_HTTP_TIMEOUT")
+    if not raw:
+        return _DEFAULT_HTTP_TIMEOUT
+    try:
+        value = float(raw)
+    except ValueError:
+        logger.warning("Invalid TWILIO_HTTP_TIMEOUT=%r; using %ss", raw, _DEFAULT_HTTP_TIMEOUT)
+        return _DEFAULT_HTTP_TIMEOUT
+    return value if value > 0 else _DEFAULT_HTTP_TIMEOUT
+
+
+# Seconds before a Twilio REST call is abandoned. The SDK default is no
+# timeout, which lets a stalled connection pin a request or worker thread.
+TWILIO_HTTP_TIMEOUT = _http_timeout_from_env()
+
 
 @dataclass
 class TwilioService:
@@ -39,9 +61,19 @@ class TwilioService:
     settings: TwilioSettings
 
     def __post_init__(self) -> None:
-        """Initialize Twilio REST client after dataclass creation."""
+        """
+        Initialize Twilio REST client after dataclass creation.
+
+        Same pooled HTTP client the SDK builds by default, plus a request
+        timeout (``TWILIO_HTTP_TIMEOUT``) so a stalled call cannot hang.
+        """
         try:
-            self.client = Client(self.settings.account_sid, self.settings.auth_token)
+            http_client = TwilioHttpClient(timeout=TWILIO_HTTP_TIMEOUT)
+            self.client = Client(
+                self.settings.account_sid,
+                self.settings.auth_token,
+                http_client=http_client,
+            )
         except Exception as exc:
             raise ConfigurationError(
                 f"Failed to initialize Twilio client: {exc}"
@@ -275,6 +307,10 @@ class TwilioService:
     def list_messages(self, **filters):
         return self.client.messages.list(**filters)
 
+    def stream_messages(self, **filters):
+        """Iterate messages lazily; Twilio pages are fetched as the iterator advances."""
+        return self.client.messages.stream(**filters)
+
     def redact_message(self, sid: str):
         return self.client.messages(sid).update(body="")
 
@@ -287,7 +323,7 @@ class TwilioService:
     def _encode_content_variables(value: Dict[str, Any] | str) -> str:
         if isinstance(value, str):
             return value
-        return json.dumps(value)
+        return dumps_json(value)
 
     def send_with_default_origin(self, *, to: str, body: str):
         """Send an SMS using default Twilio credentials and default_from number."""
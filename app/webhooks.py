@@ -1,25 +1,41 @@
 from __future__ import annotations
 
+import base64
+import functools
+import hashlib
+import hmac
 import io
+import itertools
 import json
+import logging
+import operator
 import os
 import re
 import shutil
 import tempfile
+import threading
 import time
 import zipfile
-from datetime import datetime, timezone
-from typing import Optional, Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Any, Dict, Iterable, Iterator, List, Mapping, Tuple
 from urllib.parse import unquote
+from xml.sax.saxutils import escape as xml_escape
 
-from flask import Blueprint, current_app, request, Response, jsonify, send_file
+from flask import Blueprint, after_this_request, current_app, request, Response, jsonify, send_file, stream_with_context
 from twilio.request_validator import RequestValidator
-from openai import OpenAI, OpenAIError
+from openai import OpenAIError
 
-from .chat_logic import build_chat_engine
-from .ai_service import AIResponder, AIReplyError, send_ai_generated_sms
+from .chat_logic import BaseChatEngine, build_chat_engine
+from .ai_service import AIResponder, AIReplyError, get_openai_client, send_ai_generated_sms
 from .twilio_client import TwilioService
 from .auto_reply import enqueue_auto_reply
+from .persistence_queue import (
+    enqueue_message_rows,
+    enqueue_status_update,
+    enqueue_status_updates,
+    wait_for_pending_writes,
+)
 from .database import (
     get_auto_reply_config,
     set_auto_reply_config,
@@ -33,23 +49,29 @@ from .database import (
     get_listener_by_command,
     update_listener_config,
     has_outbound_reply_for_inbound,
+    try_acquire_lease,
 )
 from .database import (
     list_scheduled_messages,
+    get_scheduled_message,
     create_scheduled_message,
     update_scheduled_message,
     delete_scheduled_message,
 )
 from .database import (
     insert_message,
+    iter_messages,
     list_messages,
     update_message_status_by_sid,
+    update_message_statuses_bulk,
     get_message_stats,
     upsert_message,
+    upsert_messages_bulk,
     delete_message_by_sid,
     list_conversations,
     list_conversation_message_refs,
     delete_conversation_messages,
+    MESSAGE_DIRECTIONS,
 )
 from .database import (
     create_multi_sms_batch,
@@ -67,9 +89,11 @@ from .faiss_service import (
     ARTICLES_JSONL_PATH,
 )
 from .validators import E164_PATTERN as E164_RE
+from .json_utils import dumps as dumps_json, dumps_bytes as dumps_json_bytes, loads as loads_json
 
 NEWS_CONFIG_PATH = os.path.join(DATA_DIR, "news_config.json")
 MAX_FAISS_BACKUP_BYTES = 250 * 1024 * 1024  # 250 MB safety limit
+MAX_TWILIO_WEBHOOK_BYTES = 64 * 1024  # Twilio callbacks are a few KB of form fields
 
 
 DEFAULT_NEWS_PROMPT = "Wygeneruj krótkie podsumowanie najważniejszych newsów."
@@ -94,20 +118,186 @@ FAISS_BACKUP_FILES = [
 webhooks_bp = Blueprint("webhooks", __name__)
 
 
+class _RuntimeRefs:
+    """
+    Module-level references to the objects handlers read on every request.
+
+    Bound once by :func:`init_runtime` at app start-up and re-bound whenever
+    :func:`reload_runtime_settings` swaps them, so hot paths skip the
+    ``current_app`` proxy and ``app.config`` lookups. The holder object stays
+    the same; only its attributes are replaced.
+    """
+
+    __slots__ = ("twilio_settings", "twilio_client", "chat_engine")
+
+    def __init__(self) -> None:
+        self.twilio_settings = None
+        self.twilio_client: Optional[TwilioService] = None
+        self.chat_engine: Optional[BaseChatEngine] = None
+
+
+_runtime = _RuntimeRefs()
+
+
+def init_runtime(app) -> None:
+    """Bind runtime references from ``app.config`` (call after settings change)."""
+    _runtime.twilio_settings = app.config.get("TWILIO_SETTINGS")
+    _runtime.twilio_client = app.config.get("TWILIO_CLIENT")
+    _runtime.chat_engine = app.config.get("CHAT_ENGINE")
+
+
 CHAT_HISTORY_LIMIT = 50
 
+_ISO_DATE_PREFIX_RE = re.compile(r"\d{4}-?\d{2}-?\d{2}")
+
+# Twilio directions are "inbound" or "outbound-api" / "outbound-reply" / ...
+_INBOUND_PREFIX = "inbound"
+_MESSAGE_DATE_FIELDS = ("date_created", "date_updated", "date_sent")
+_TRUTHY_ARG_VALUES = frozenset({"1", "true", "yes", "y"})
+
+# Serialises Twilio history syncs within this process (see _maybe_sync_messages)
+_SYNC_LOCK = threading.Lock()
+SYNC_INTERVAL = 10.0  # seconds between Twilio history syncs
+_SYNC_LEASE_KEY = "twilio_sync_lease"
+
+# /twilio/status bodies carrying many status updates at once
+_STATUS_BATCH_MIMETYPES = frozenset({"application/json", "application/x-ndjson"})
+
+_FALSY_ENV_VALUES = frozenset({"0", "false", "no", "off"})
+# Allow disabling validation for local testing (e.g., ngrok); read once at import
+_SIGNATURE_VALIDATION_DISABLED = (
+    os.getenv("TWILIO_VALIDATE_SIGNATURE", "true").strip().lower() in _FALSY_ENV_VALUES
+)
+
 # Deduplikacja teraz odbywa się przez sprawdzanie bazy danych
 # Funkcja has_outbound_reply_for_inbound() sprawdza czy wysłaliśmy odpowiedź
 
 
+@functools.lru_cache(maxsize=4096)
 def _datetime_to_iso(value: Optional[datetime]) -> Optional[str]:
+    # Synced pages repeat the same timestamps across created/updated/sent.
     if value is None:
         return None
-    if value.tzinfo is None:
-        value = value.replace(tzinfo=timezone.utc)
-    else:
-        value = value.astimezone(timezone.utc)
-    return value.strftime("%Y-%m-%dT%H:%M:%S")
+    if value.tzinfo is timezone.utc:
+        # Twilio returns UTC datetimes; skip the astimezone() conversion
+        value = value.replace(tzinfo=None)
+    elif value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.isoformat(timespec="seconds")
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as ISO 8601 with a ``Z`` suffix (timestamps kept in JSON configs)."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+_TWIML_EMPTY = '<?xml version="1.0" encoding="UTF-8"?><Response></Response>'
+_TWIML_MESSAGE = '<?xml version="1.0" encoding="UTF-8"?><Response><Message>{body}</Message></Response>'
+
+
+def _twiml_response(reply_text: Optional[str] = None) -> Response:
+    """Return a TwiML document from the prebuilt envelope (empty or one <Message>)."""
+    if not reply_text:
+        return Response(_TWIML_EMPTY, mimetype="application/xml")
+    return Response(_TWIML_MESSAGE.format(body=xml_escape(reply_text)), mimetype="application/xml")
+
+
+def _clamp_int(raw: Any, *, default: int, upper: int, lower: int = 1) -> int:
+    """Parse ``raw`` as an int clamped to ``[lower, upper]``; ``default`` if missing or invalid."""
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except (TypeError, ValueError):
+        return default
+    return lower if value < lower else upper if value > upper else value
+
+
+def _limit_arg(*, default: int, upper: int) -> int:
+    """Read the ``limit`` query argument for list endpoints."""
+    return _clamp_int(request.args.get("limit"), default=default, upper=upper)
+
+
+def _direction_arg() -> Optional[str]:
+    """
+    Read the optional ``direction`` query argument for message listings.
+
+    Raises:
+        ValueError: If the value is neither ``inbound`` nor ``outbound``
+    """
+    direction = (request.args.get("direction") or "").strip().lower()
+    if not direction:
+        return None
+    if direction not in MESSAGE_DIRECTIONS:
+        raise ValueError("Parametr 'direction' musi mieć wartość 'inbound' lub 'outbound'.")
+    return direction
+
+
+def _message_cursor(row: Mapping[str, Any]) -> str:
+    """Keyset cursor (``<created_at>:<id>``) pointing just past a stored message row."""
+    return f"{row['created_at']}:{row['id']}"
+
+
+def _cursor_arg() -> Optional[Tuple[str, int]]:
+    """
+    Read the optional ``cursor`` query argument (a ``next_cursor`` value).
+
+    Raises:
+        ValueError: If the cursor is not ``<created_at>:<id>``
+    """
+    raw = (request.args.get("cursor") or "").strip()
+    if not raw:
+        return None
+    created_at, _, row_id = raw.rpartition(":")
+    if not created_at or not row_id.isdigit() or _parse_iso_timestamp(created_at) is None:
+        raise ValueError("Nieprawidłowy parametr 'cursor'.")
+    return created_at, int(row_id)
+
+
+def _read_json_object() -> Dict[str, Any]:
+    """
+    Parse the request body as a JSON object, like ``get_json(force=True, silent=True) or {}``.
+
+    The raw body is read without caching it on the request and parsed with
+    the fast JSON backend; anything that is not a JSON object yields ``{}``.
+    """
+    raw = request.get_data(cache=False)
+    if not raw:
+        return {}
+    try:
+        payload = loads_json(raw)
+    except ValueError:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _stream_items_response(items: Iterable[Dict[str, Any]], page_size: Optional[int] = None) -> Response:
+    """
+    Stream ``{"items": [...], "count": N}`` without materialising the list.
+
+    Each item is serialised as it is produced, so memory stays bounded by one
+    row regardless of the page size. ``count`` is emitted after the last item.
+    With ``page_size`` (stored message rows only) a ``next_cursor`` follows:
+    the cursor of the last row when the page is full, otherwise ``null``.
+    """
+
+    def generate() -> Iterator[str]:
+        count = 0
+        last: Optional[Dict[str, Any]] = None
+        yield '{"items":['
+        for item in items:
+            if count:
+                yield ","
+            yield dumps_json(item)
+            count += 1
+            last = item
+        if page_size is None:
+            yield f'],"count":{count}}}'
+            return
+        next_cursor = _message_cursor(last) if last is not None and count >= page_size else None
+        yield f'],"count":{count},"next_cursor":{dumps_json(next_cursor)}}}'
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
 
 
 def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
@@ -119,27 +309,156 @@ def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
         return None
 
 
+# Twilio MessageInstance attributes read by the helpers below, fetched in one
+# attrgetter call; _MESSAGE_DICT_KEYS are the matching API response keys.
+_MESSAGE_FIELDS = (
+    "sid",
+    "status",
+    "direction",
+    "from_",
+    "to",
+    "body",
+    "num_media",
+    "num_segments",
+    "error_code",
+    "error_message",
+    "messaging_service_sid",
+    "price",
+    "price_unit",
+    "date_created",
+    "date_updated",
+    "date_sent",
+)
+_MESSAGE_DICT_KEYS = tuple("from" if name == "from_" else name for name in _MESSAGE_FIELDS)
+_get_message_fields = operator.attrgetter(*_MESSAGE_FIELDS)
+
+
+# Compact listing shape for /api/messages/remote (``?full=1`` returns every field)
+_SUMMARY_FIELDS = (
+    "sid",
+    "status",
+    "direction",
+    "from_",
+    "to",
+    "body",
+    "error_code",
+    "date_created",
+    "date_updated",
+    "date_sent",
+)
+_SUMMARY_DICT_KEYS = tuple("from" if name == "from_" else name for name in _SUMMARY_FIELDS)
+_get_summary_fields = operator.attrgetter(*_SUMMARY_FIELDS)
+
+
+# Subset needed for database rows (see _twilio_message_row)
+_ROW_FIELDS = (
+    "sid",
+    "status",
+    "direction",
+    "from_",
+    "to",
+    "body",
+    "error_code",
+    "error_message",
+    "date_created",
+    "date_updated",
+)
+_get_row_fields = operator.attrgetter(*_ROW_FIELDS)
+
+
+def _message_field_values(message, getter=_get_message_fields, fields=_MESSAGE_FIELDS) -> tuple:
+    try:
+        return getter(message)
+    except AttributeError:
+        # Partial objects (e.g. test doubles) fall back to per-field defaults
+        return tuple(getattr(message, name, None) for name in fields)
+
+
+# Fields _maybe_enqueue_auto_reply_for_message reads; dates in received-at preference order
+_AUTO_REPLY_FIELDS = ("sid", "from_", "to", "body", "date_created", "date_sent", "date_updated")
+_get_auto_reply_fields = operator.attrgetter(*_AUTO_REPLY_FIELDS)
+
+
+def _is_inbound(message) -> bool:
+    return (getattr(message, "direction", None) or "").startswith(_INBOUND_PREFIX)
+
+
+def _twilio_message_row(message) -> Dict[str, Any]:
+    """Map a Twilio message instance to ``upsert_message`` keyword arguments."""
+    (
+        sid, status, direction, from_, to, body,
+        error_code, error_message, date_created, date_updated,
+    ) = _message_field_values(message, _get_row_fields, _ROW_FIELDS)
+
+    return {
+        "sid": sid,
+        "direction": "inbound" if (direction or "").startswith(_INBOUND_PREFIX) else "outbound",
+        "to_number": to,
+        "from_number": from_,
+        "body": body or "",
+        "status": status,
+        "error": error_message or (f"Error code: {error_code}" if error_code else None),
+        "created_at": _datetime_to_iso(date_created),
+        "updated_at": _datetime_to_iso(date_updated),
+    }
+
+
 def _persist_twilio_message(message) -> None:
-    direction = (
-        "inbound"
-        if (getattr(message, "direction", "") or "").startswith("inbound")
-        else "outbound"
-    )
-    error_details = message.error_message or (
-        f"Error code: {message.error_code}" if getattr(message, "error_code", None) else None
-    )
+    upsert_message(**_twilio_message_row(message))
 
-    upsert_message(
-        sid=message.sid,
-        direction=direction,
-        to_number=getattr(message, "to", None),
-        from_number=getattr(message, "from_", None),
-        body=getattr(message, "body", "") or "",
-        status=getattr(message, "status", None),
-        error=error_details,
-        created_at=_datetime_to_iso(getattr(message, "date_created", None)),
-        updated_at=_datetime_to_iso(getattr(message, "date_updated", None)),
-    )
+
+def _persist_twilio_messages(messages: List[Any]) -> None:
+    """Upsert a page of Twilio messages in one transaction, in chunked batches."""
+    upsert_messages_bulk(_twilio_message_row(message) for message in messages)
+
+
+# Synced inbound messages newer than this also get a reply (e.g. ones that
+# arrived while webhooks were failing); older history is left alone.
+SYNC_REPLY_WINDOW = timedelta(minutes=15)
+
+
+def _enqueue_auto_replies_for_recent_inbound(messages: Iterable[Any]) -> None:
+    """Queue replies for synced inbound messages, newest first and one per sender.
+
+    The newest inbound message is always considered (as before); other
+    senders only when their message falls within ``SYNC_REPLY_WINDOW``.
+    The worker and ``_maybe_enqueue_auto_reply_for_message`` skip messages
+    that already have a reply.
+    """
+    cutoff_iso = _datetime_to_iso(datetime.now(timezone.utc) - SYNC_REPLY_WINDOW)
+    senders: set = set()
+    for message in messages:  # Twilio lists newest-first
+        if not _is_inbound(message):
+            continue
+        sender = getattr(message, "from_", None)
+        if sender in senders:
+            continue
+        if senders:
+            created_iso = _datetime_to_iso(getattr(message, "date_created", None))
+            if not created_iso or created_iso < cutoff_iso:
+                continue
+        senders.add(sender)
+        _maybe_enqueue_auto_reply_for_message(message)
+
+
+def _persist_twilio_message_later(message) -> None:
+    """Refresh the local copy of a message via the write-behind queue.
+
+    Falls back to a synchronous upsert when the persistence worker is not
+    running in this process or its queue is full.
+    """
+    _persist_twilio_messages_later([message])
+
+
+def _persist_twilio_messages_later(messages: Iterable[Any]) -> None:
+    """Queue upserts for several Twilio messages as one write-behind batch."""
+    _persist_message_rows_later([_twilio_message_row(message) for message in messages])
+
+
+def _persist_message_rows_later(rows: List[Dict[str, Any]]) -> None:
+    """Queue message rows as one write-behind batch; written inline when no worker runs."""
+    if rows and not enqueue_message_rows(current_app._get_current_object(), rows):
+        upsert_messages_bulk(rows)
 
 
 def send_ai_message_to_configured_target(
@@ -166,10 +485,7 @@ def send_ai_message_to_configured_target(
     if not normalized_target:
         raise AIReplyError("Brak skonfigurowanego numeru AI.", status_code=400)
 
-    try:
-        resolved_history_limit = max(1, min(int(history_limit), 200))
-    except (TypeError, ValueError):
-        resolved_history_limit = 20
+    resolved_history_limit = _clamp_int(history_limit, default=20, upper=200)
 
     responder = AIResponder(
         api_key=api_key,
@@ -200,7 +516,7 @@ def send_ai_message_to_configured_target(
     if not reply_text:
         raise AIReplyError("OpenAI nie zwróciło treści odpowiedzi.", status_code=502)
 
-    twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+    twilio_client: TwilioService = _runtime.twilio_client
 
     dispatch_result = send_ai_generated_sms(
         responder=responder,
@@ -227,25 +543,72 @@ def send_ai_message_to_configured_target(
     }
 
 
+@functools.lru_cache(maxsize=4)
+def _get_validator(auth_token: str) -> RequestValidator:
+    # One validator per auth token; a settings reload with a new token gets its own.
+    return RequestValidator(auth_token)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_signing_key(auth_token: str) -> bytes:
+    return auth_token.encode("utf-8")
+
+
+def _fast_validate(url: str, params: Mapping[str, str], signature: str, key: bytes) -> bool:
+    """Check a form webhook signature with one HMAC-SHA1 over the URL as received.
+
+    ``RequestValidator`` signs the URL both with and without an explicit port
+    (two HMACs per request); callers fall back to it when this check fails.
+    """
+    payload = url + "".join(name + params[name] for name in sorted(params))
+    digest = hmac.new(key, payload.encode("utf-8"), hashlib.sha1).digest()
+    return hmac.compare_digest(base64.b64encode(digest), signature.encode("utf-8"))
+
+
 def _validate_twilio_signature(req) -> bool:
-    # Allow disabling validation for local testing (e.g., ngrok) via env flag
-    if os.getenv("TWILIO_VALIDATE_SIGNATURE", "true").lower() in {"0", "false", "no", "off"}:
+    if req.content_length and req.content_length > MAX_TWILIO_WEBHOOK_BYTES:
+        # Oversized bodies cannot be genuine callbacks; refuse before parsing
+        # them, also when signature validation is disabled
+        current_app.logger.warning(
+            "Twilio webhook body too large for %s (%s bytes)", req.path, req.content_length
+        )
+        return False
+
+    if _SIGNATURE_VALIDATION_DISABLED:
         current_app.logger.warning("Skipping Twilio signature validation (TWILIO_VALIDATE_SIGNATURE disabled)")
         return True
 
-    settings = current_app.config.get("TWILIO_SETTINGS")
+    settings = _runtime.twilio_settings
     if not settings or not settings.auth_token:
         current_app.logger.error("Missing Twilio auth token; cannot validate signature")
         return False
 
     signature = req.headers.get("X-Twilio-Signature", "")
-    validator = RequestValidator(settings.auth_token)
+    if not signature:
+        # Nothing to compare against: reject before the body is read or parsed
+        current_app.logger.warning("Missing Twilio signature for %s", req.path)
+        return False
 
     # Flask preserves the raw URL including query string; Twilio expects exactly that
     url = req.url
-    params = req.form.to_dict(flat=False) or req.form.to_dict() or {}
-
-    is_valid = validator.validate(url, params, signature)
+    if req.mimetype in _STATUS_BATCH_MIMETYPES:
+        # JSON bodies are signed via the bodySHA256 query parameter; without
+        # it RequestValidator raises instead of returning False.
+        if "bodySHA256" not in req.args:
+            current_app.logger.warning("Missing bodySHA256 for signed JSON body on %s", req.path)
+            return False
+        params = req.get_data(as_text=True)
+    else:
+        # The parsed form is checked in place; the dict copy is only built
+        # for the RequestValidator fallback and the failure log.
+        form = req.form
+        if _fast_validate(url, form, signature, _get_signing_key(settings.auth_token)):
+            current_app.logger.debug("Twilio signature validated for %s", req.path)
+            return True
+        # Twilio form posts carry one value per key
+        params = form.to_dict()
+
+    is_valid = _get_validator(settings.auth_token).validate(url, params, signature)
     if not is_valid:
         current_app.logger.warning(
             "Invalid Twilio signature for %s (sig=%s, url=%s, params=%s)",
@@ -269,7 +632,7 @@ def _handle_news_listener_sync(from_number: str, to_number: str, body: str, sid:
             current_app.logger.debug("/news: SID %s already replied to %s, skipping", sid, from_number)
             return
 
-    twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+    twilio_client: TwilioService = _runtime.twilio_client
 
     # Wyciągnij zapytanie po /news
     query = body.strip()[5:].strip()  # Usuń "/news" z początku
@@ -322,36 +685,19 @@ def _maybe_enqueue_auto_reply_for_message(message) -> None:
     Wszystko jest przetwarzane ASYNCHRONICZNIE przez worker w tle.
     """
 
-    # Pobierz dane wiadomości
-    body = getattr(message, "body", "") or ""
-    direction = getattr(message, "direction", "") or ""
-    
-    if not direction.startswith("inbound"):
+    if not _is_inbound(message):
         return
 
-    from_number = (getattr(message, "from_", "") or "").strip()
-    to_number = (getattr(message, "to", "") or "").strip()
-    sid = getattr(message, "sid", None)
-
-    # DEDUPLIKACJA: Sprawdź w bazie czy już wysłaliśmy odpowiedź do tego nadawcy
-    if sid and from_number:
-        if has_outbound_reply_for_inbound(sid, from_number):
-            current_app.logger.debug(
-                "Skipping message SID=%s - already replied to %s", sid, from_number
-            )
-            return
-
-    auto_cfg = get_auto_reply_config()
-    ai_cfg = get_ai_config()
+    # Najpierw konfiguracja (z cache), dopiero potem zapytanie deduplikujące
+    ai_enabled = bool(get_ai_config().get("enabled"))
+    auto_enabled = bool(get_auto_reply_config().get("enabled"))
 
-    ai_enabled = bool(ai_cfg.get("enabled"))
-    auto_enabled = bool(auto_cfg.get("enabled"))
+    # Listener * steruje tylko auto-reply (AI działa niezależnie od listenera *)
+    default_listener_enabled = None
+    if not ai_enabled and auto_enabled:
+        default_listener = get_listener_by_command("*")
+        default_listener_enabled = default_listener and default_listener.get("enabled")
 
-    # Sprawdź listener * dla auto-reply (AI działa niezależnie od listenera *)
-    default_listener = get_listener_by_command("*")
-    default_listener_enabled = default_listener and default_listener.get("enabled")
-    
-    # Dla wszystkich wiadomości - sprawdź czy AI lub auto-reply jest włączone
     if not ai_enabled and (not auto_enabled or not default_listener_enabled):
         current_app.logger.debug(
             "No active response for polling: ai=%s, auto=%s, listener*=%s",
@@ -359,19 +705,28 @@ def _maybe_enqueue_auto_reply_for_message(message) -> None:
         )
         return
 
+    # Pobierz dane wiadomości
+    sid, from_number, to_number, body, *dates = _message_field_values(
+        message, _get_auto_reply_fields, _AUTO_REPLY_FIELDS
+    )
+    from_number = (from_number or "").strip()
+    to_number = (to_number or "").strip()
+    body = body or ""
+
+    # DEDUPLIKACJA: Sprawdź w bazie czy już wysłaliśmy odpowiedź do tego nadawcy
+    if sid and from_number:
+        if has_outbound_reply_for_inbound(sid, from_number):
+            current_app.logger.debug(
+                "Skipping message SID=%s - already replied to %s", sid, from_number
+            )
+            return
+
     # ─────────────────────────────────────────────────────────
     # ENQUEUE do workera w tle - asynchroniczne przetwarzanie
     # Worker obsłuży: AI reply, /news listener, auto-reply
     # ─────────────────────────────────────────────────────────
-    received_at_iso = None
-    for attr in ("date_created", "date_sent", "date_updated"):
-        dt_value = getattr(message, attr, None)
-        if dt_value:
-            received_at_iso = _datetime_to_iso(dt_value)
-            if received_at_iso:
-                break
-    if not received_at_iso:
-        received_at_iso = _datetime_to_iso(datetime.utcnow())
+    received_at = next((value for value in dates if value), None) or datetime.now(timezone.utc)
+    received_at_iso = _datetime_to_iso(received_at)
 
     enqueue_auto_reply(
         current_app,
@@ -432,7 +787,7 @@ def _available_openai_models() -> List[str]:
 
 
 def _list_openai_chat_models(api_key: str) -> List[str]:
-    client = OpenAI(api_key=api_key)
+    client = get_openai_client(api_key)
     try:
         response = client.models.list()
     except OpenAIError as exc:
@@ -471,7 +826,7 @@ def _extract_multi_sms_recipients(payload: Dict[str, Any]) -> List[str]:
 
 
 def _sender_identity_label() -> str:
-    settings = current_app.config["TWILIO_SETTINGS"]
+    settings = _runtime.twilio_settings
     if settings.messaging_service_sid:
         return f"Messaging Service {settings.messaging_service_sid}"
     if settings.default_from:
@@ -520,7 +875,7 @@ def _load_news_config() -> Dict[str, Any]:
 def _save_news_config(cfg: Dict[str, Any]) -> Dict[str, Any]:
     data = _default_news_config()
     data.update(cfg)
-    data["updated_at"] = datetime.utcnow().isoformat() + "Z"
+    data["updated_at"] = _utc_now_iso()
     os.makedirs(os.path.dirname(NEWS_CONFIG_PATH), exist_ok=True)
     with open(NEWS_CONFIG_PATH, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
@@ -730,7 +1085,7 @@ def _delete_faiss_index(name: str) -> Dict[str, Any]:
 def _send_ai_reply_message(*, inbound_from: str, inbound_to: str, reply_text: str):
     """Send AI-generated reply back to the original sender via Twilio."""
 
-    twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+    twilio_client: TwilioService = _runtime.twilio_client
     message = twilio_client.send_reply_to_inbound(
         inbound_from=inbound_from,
         inbound_to=inbound_to,
@@ -752,25 +1107,18 @@ def _serialize_ai_config(cfg: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
-def _twilio_message_to_dict(message) -> Dict[str, Any]:
-    return {
-        "sid": message.sid,
-        "status": getattr(message, "status", None),
-        "direction": getattr(message, "direction", None),
-        "from": getattr(message, "from_", None),
-        "to": getattr(message, "to", None),
-        "body": getattr(message, "body", None),
-        "num_media": getattr(message, "num_media", None),
-        "num_segments": getattr(message, "num_segments", None),
-        "error_code": getattr(message, "error_code", None),
-        "error_message": getattr(message, "error_message", None),
-        "messaging_service_sid": getattr(message, "messaging_service_sid", None),
-        "price": getattr(message, "price", None),
-        "price_unit": getattr(message, "price_unit", None),
-        "date_created": _datetime_to_iso(getattr(message, "date_created", None)),
-        "date_updated": _datetime_to_iso(getattr(message, "date_updated", None)),
-        "date_sent": _datetime_to_iso(getattr(message, "date_sent", None)),
-    }
+def _twilio_message_to_dict(message, full: bool = True) -> Dict[str, Any]:
+    if full:
+        item = dict(zip(_MESSAGE_DICT_KEYS, _message_field_values(message)))
+    else:
+        values = _message_field_values(message, _get_summary_fields, _SUMMARY_FIELDS)
+        item = dict(zip(_SUMMARY_DICT_KEYS, values))
+    for key in _MESSAGE_DATE_FIELDS:
+        item[key] = _datetime_to_iso(item[key])
+    return item
+
+
+_SEQUENCE_TYPES = (list, tuple)
 
 
 def _coerce_media_urls(value: Any) -> Optional[List[str]]:
@@ -779,8 +1127,8 @@ def _coerce_media_urls(value: Any) -> Optional[List[str]]:
     if isinstance(value, str):
         cleaned = value.strip()
         return [cleaned] if cleaned else None
-    if isinstance(value, list | tuple):
-        cleaned_list = [str(item) for item in value if str(item).strip()]
+    if isinstance(value, _SEQUENCE_TYPES):
+        cleaned_list = [text for text in map(str, value) if text.strip()]
         return cleaned_list or None
     return None
 
@@ -791,13 +1139,16 @@ def _encode_content_variables(value: Any) -> Optional[str]:
     if isinstance(value, str):
         return value
     try:
-        return json.dumps(value)
-    except TypeError:
+        # Same encoder as TwilioService._encode_content_variables (orjson when installed)
+        return dumps_json(value)
+    except TypeError:  # orjson.JSONEncodeError subclasses TypeError
         return None
 
 
+@functools.lru_cache(maxsize=256)
 def _parse_datetime_arg(raw_value: Optional[str]) -> Optional[datetime]:
-    if not raw_value:
+    # Cached per raw query value, so repeated (including invalid) filters skip parsing
+    if not raw_value or not _ISO_DATE_PREFIX_RE.match(raw_value):
         return None
     try:
         # datetime.fromisoformat supports timezone-aware inputs as well
@@ -807,27 +1158,76 @@ def _parse_datetime_arg(raw_value: Optional[str]) -> Optional[datetime]:
 
 
 def _maybe_sync_messages(limit: int = 50) -> None:
-    cache = current_app.config.setdefault("TWILIO_SYNC_CACHE", {"last_sync": 0.0})
-    now = time.time()
-    if now - cache.get("last_sync", 0.0) < 10:
+    """Pull recent messages from Twilio at most once per ``SYNC_INTERVAL``.
+
+    Only one sync runs at a time; concurrent callers skip instead of issuing
+    duplicate ``messages.list`` calls and rely on the in-flight one. Across
+    gunicorn workers a database lease (``try_acquire_lease``) lets a single
+    process sync per interval; the others read what it stored. The
+    first sync in a process runs inline so callers see remote history;
+    later refreshes run on a background thread and callers read what is
+    already stored (at most one sync interval stale).
+    """
+    app = current_app._get_current_object()
+    cache = app.config.setdefault("TWILIO_SYNC_CACHE", {"last_sync": None})
+    last_sync = cache.get("last_sync")
+    if last_sync is not None and time.monotonic() - last_sync < SYNC_INTERVAL:
         return
-
-    twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
-    try:
-        remote_messages = twilio_client.client.messages.list(limit=limit)
-    except Exception as exc:  # noqa: BLE001
-        current_app.logger.warning("Unable to sync messages from Twilio: %s", exc)
-        cache["last_sync"] = now
+    if not _SYNC_LOCK.acquire(blocking=False):
         return
 
-    first_inbound_enqueued = False
-    for message in remote_messages:
-        _persist_twilio_message(message)
-        if not first_inbound_enqueued and (getattr(message, "direction", "") or "").startswith("inbound"):
-            _maybe_enqueue_auto_reply_for_message(message)
-            first_inbound_enqueued = True
-
-    cache["last_sync"] = now
+    if last_sync is None:
+        _sync_messages_locked(app, limit)
+        return
+    try:
+        threading.Thread(
+            target=_sync_messages_locked,
+            args=(app, limit, True),
+            name="twilio-sync",
+            daemon=True,
+        ).start()
+    except RuntimeError:
+        _SYNC_LOCK.release()
+        raise
+
+
+def _sync_messages_locked(app, limit: int, background: bool = False) -> None:
+    """Run one Twilio history sync; the caller holds ``_SYNC_LOCK``.
+
+    Background runs log failures instead of raising them; ``last_sync``
+    stays unset so the next caller retries.
+    """
+    try:
+        with app.app_context():
+            cache = app.config["TWILIO_SYNC_CACHE"]
+            # Re-check: a sync may have finished between the caller's check and acquire()
+            last_sync = cache.get("last_sync")
+            now = time.monotonic()
+            if last_sync is not None and now - last_sync < SYNC_INTERVAL:
+                return
+            if not try_acquire_lease(_SYNC_LEASE_KEY, SYNC_INTERVAL):
+                # Another worker synced within the interval
+                cache["last_sync"] = now
+                return
+
+            twilio_client: TwilioService = _runtime.twilio_client
+            try:
+                remote_messages = twilio_client.client.messages.list(limit=limit)
+            except Exception as exc:  # noqa: BLE001
+                app.logger.warning("Unable to sync messages from Twilio: %s", exc)
+                cache["last_sync"] = now
+                return
+
+            _persist_twilio_messages(remote_messages)
+            _enqueue_auto_replies_for_recent_inbound(remote_messages)
+            cache["last_sync"] = now
+            cache["synced_at"] = _utc_now_iso()
+    except Exception:
+        if not background:
+            raise
+        app.logger.exception("Background Twilio sync failed")
+    finally:
+        _SYNC_LOCK.release()
 
 
 @webhooks_bp.post("/twilio/inbound")
@@ -838,51 +1238,75 @@ def inbound_message():
     if not _validate_twilio_signature(request):
         return Response("Forbidden", status=403)
 
-    app.logger.info("Received inbound hook: %s", request.form.to_dict())
-
     # Extract and validate webhook parameters
-    from_number = (request.form.get("From") or "").strip()
-    to_number = (request.form.get("To") or "").strip()
-    body = (request.form.get("Body") or "").strip()
-    message_sid = (request.form.get("MessageSid") or "").strip() or None
-    message_status = (request.form.get("SmsStatus") or "").strip() or None
+    form = request.form
+    from_number = (form.get("From") or "").strip()
+    to_number = (form.get("To") or "").strip()
+    body = (form.get("Body") or "").strip()
+    message_sid = (form.get("MessageSid") or "").strip() or None
+    message_status = (form.get("SmsStatus") or "").strip() or None
+
+    app.logger.info(
+        "Received inbound hook: sid=%s from=%s to=%s status=%s",
+        message_sid, from_number, to_number, message_status,
+    )
 
     # Validate required parameters
     if not from_number or not to_number:
         app.logger.warning("Missing required webhook parameters: From=%s, To=%s", from_number, to_number)
-        return Response("<?xml version=\"1.0\" encoding=\"UTF-8\"?><Response></Response>", mimetype="application/xml")
+        return _twiml_response()
 
-    received_at_iso = _datetime_to_iso(datetime.utcnow())
+    received_at_iso = _datetime_to_iso(datetime.now(timezone.utc))
 
-    # Store the incoming message
-    try:
-        if message_sid:
-            upsert_message(
-                sid=message_sid,
-                direction="inbound",
-                to_number=to_number,
-                from_number=from_number,
-                body=body,
-                status=message_status,
-                error=None,
-                created_at=None,
-                updated_at=None,
-            )
-        else:
-            insert_message(
-                direction="inbound",
-                sid=None,
-                to_number=to_number,
-                from_number=from_number,
-                body=body,
-                status=message_status,
+    # The inbound row is written together with any reply rows in one
+    # transaction: immediately before a step that reads it back (AI history,
+    # auto-reply worker), otherwise via the write-behind queue or, without a
+    # worker, right after the response has been sent.
+    pending_rows: List[Dict[str, Any]] = [
+        {
+            "sid": message_sid,
+            "direction": "inbound",
+            "to_number": to_number,
+            "from_number": from_number,
+            "body": body,
+            "status": message_status,
+            "error": None,
+        }
+    ]
+
+    app_obj = app._get_current_object()
+
+    def write_rows(rows: List[Dict[str, Any]]) -> None:
+        try:
+            upsert_messages_bulk(rows)
+            app_obj.logger.info(
+                "Stored %d message row(s) for inbound from %s to %s (SID: %s)",
+                len(rows), from_number, to_number, message_sid or "N/A",
             )
-        app.logger.info(
-            "Stored inbound message from %s to %s (SID: %s)", 
-            from_number, to_number, message_sid or "N/A"
-        )
-    except Exception as exc:  # noqa: BLE001
-        app.logger.exception("Failed to store inbound message: %s", exc)
+        except Exception as exc:  # noqa: BLE001
+            app_obj.logger.exception("Failed to store inbound message: %s", exc)
+
+    def store_messages(*outbound_rows: Dict[str, Any], defer: bool = True) -> None:
+        pending_rows.extend(outbound_rows)
+        if defer or not pending_rows:
+            return  # flushed by _store_pending_messages below
+        rows = pending_rows[:]
+        pending_rows.clear()
+        write_rows(rows)
+
+    @after_this_request
+    def _store_pending_messages(response: Response) -> Response:
+        rows = pending_rows[:]
+        pending_rows.clear()
+        if rows and not enqueue_message_rows(app_obj, rows):
+            # No write-behind worker in this process: write once the response
+            # has been sent, so Twilio does not wait for the commit.
+            def write_after_response() -> None:
+                with app_obj.app_context():
+                    write_rows(rows)
+
+            response.call_on_close(write_after_response)
+        return response
 
     # DEDUPLIKACJA: Sprawdź w bazie czy już wysłaliśmy odpowiedź do tego nadawcy
     if message_sid and from_number:
@@ -892,7 +1316,7 @@ def inbound_message():
             )
             return Response("OK", mimetype="text/plain")
 
-    twilio_client: TwilioService = app.config["TWILIO_CLIENT"]
+    twilio_client: TwilioService = _runtime.twilio_client
 
     ai_cfg = get_ai_config()
     auto_cfg = get_auto_reply_config()
@@ -920,7 +1344,7 @@ def inbound_message():
                             inbound_to=to_number,
                             body=str(answer_text),
                         )
-                        _persist_twilio_message(message)
+                        store_messages(_twilio_message_row(message))
                         app.logger.info("Sent /news reply to %s (SID: %s)", from_number, message.sid)
                     else:
                         # Brak odpowiedzi z FAISS
@@ -930,7 +1354,7 @@ def inbound_message():
                             inbound_to=to_number,
                             body=no_answer,
                         )
-                        _persist_twilio_message(message)
+                        store_messages(_twilio_message_row(message))
                         app.logger.info("Sent /news no-answer reply to %s", from_number)
                 except Exception as exc:
                     app.logger.exception("Failed to process /news query: %s", exc)
@@ -943,7 +1367,7 @@ def inbound_message():
                         inbound_to=to_number,
                         body=help_msg,
                     )
-                    _persist_twilio_message(message)
+                    store_messages(_twilio_message_row(message))
                 except Exception as exc:
                     app.logger.exception("Failed to send /news help: %s", exc)
             # Listener /news obsłużył komendę
@@ -955,7 +1379,7 @@ def inbound_message():
                 inbound_to=to_number,
                 body=disabled_msg,
             )
-            _persist_twilio_message(message)
+            store_messages(_twilio_message_row(message))
             app.logger.info("/news listener disabled notice sent to %s", from_number)
         except Exception as exc:
             app.logger.exception("Failed to send /news disabled notice: %s", exc)
@@ -977,6 +1401,7 @@ def inbound_message():
             api_key = (ai_cfg.get("api_key") or "").strip()
             if api_key:
                 app.logger.info("Processing AI reply synchronously for %s", from_number)
+                store_messages(defer=False)  # AI history must include this message
                 responder = AIResponder(
                     api_key=api_key,
                     model=(ai_cfg.get("model") or "gpt-4o-mini").strip(),
@@ -994,13 +1419,18 @@ def inbound_message():
                     logger=app.logger,
                 )
                 
-                insert_message(
-                    direction="outbound",
-                    sid=result.sid,
-                    to_number=result.to_number,
-                    from_number=result.origin_number or to_number or twilio_client.settings.default_from,
-                    body=result.reply_text,
-                    status=result.status or "ai-auto-reply",
+                # Zapis od razu (nie w tle) - deduplikacja opiera się na tym wierszu
+                store_messages(
+                    {
+                        "sid": result.sid,
+                        "direction": "outbound",
+                        "to_number": result.to_number,
+                        "from_number": result.origin_number or to_number or twilio_client.settings.default_from,
+                        "body": result.reply_text,
+                        "status": result.status or "ai-auto-reply",
+                        "error": None,
+                    },
+                    defer=False,
                 )
                 
                 # Odpowiedź zapisana do bazy - deduplikacja zadziała automatycznie
@@ -1010,19 +1440,22 @@ def inbound_message():
                 app.logger.error("AI enabled but no API key configured")
         except Exception as exc:
             app.logger.exception("Synchronous AI reply failed: %s", exc)
-            insert_message(
-                direction="outbound",
-                sid=None,
-                to_number=from_number,
-                from_number=to_number or twilio_client.settings.default_from,
-                body="",
-                status="failed",
-                error=str(exc),
+            store_messages(
+                {
+                    "sid": None,
+                    "direction": "outbound",
+                    "to_number": from_number,
+                    "from_number": to_number or twilio_client.settings.default_from,
+                    "body": "",
+                    "status": "failed",
+                    "error": str(exc),
+                }
             )
 
     # Fallback to async auto-reply gdy listener * włączony i auto_enabled
     # Auto-reply wymaga włączonego listenera * (w przeciwieństwie do AI)
     if default_listener_enabled and auto_enabled:
+        store_messages(defer=False)  # worker deduplicates against the stored inbound row
         enqueue_auto_reply(
             app,
             sid=message_sid,
@@ -1041,10 +1474,14 @@ def inbound_message():
 
     # Generate auto-reply using chat engine when both AI and auto-reply are disabled
 
-    # Otherwise, fall back to chat-engine based reply (synchronous send)
+    # Otherwise, fall back to a chat-engine reply returned as TwiML
     reply_text = None
     try:
-        chat_engine = build_chat_engine()
+        chat_engine = _runtime.chat_engine
+        if chat_engine is None:
+            # Blueprint mounted without create_app(): build once and keep it
+            # (engines are stateless, so one instance serves every request).
+            chat_engine = _runtime.chat_engine = build_chat_engine()
         reply_text = chat_engine.build_reply(from_number, body)
         if reply_text:
             app.logger.info(
@@ -1057,25 +1494,21 @@ def inbound_message():
         reply_text = None
 
     if reply_text:
-        try:
-            message = twilio_client.send_reply_to_inbound(
-                inbound_from=from_number,
-                inbound_to=to_number,
-                body=reply_text,
-            )
-            _persist_twilio_message(message)
-            app.logger.info("Sent auto-reply via API to %s (SID: %s)", from_number, message.sid)
-        except Exception as exc:  # noqa: BLE001
-            app.logger.exception("Failed to send auto-reply via API: %s", exc)
-            insert_message(
-                direction="outbound",
-                sid=None,
-                to_number=from_number,
-                from_number=to_number,
-                body=reply_text,
-                status="failed",
-                error=str(exc),
-            )
+        # Reply inline as TwiML: Twilio delivers it from the receiving number,
+        # so the webhook returns without a REST round trip to send it.
+        store_messages(
+            {
+                "sid": None,
+                "direction": "outbound",
+                "to_number": from_number,
+                "from_number": to_number,
+                "body": reply_text,
+                "status": "twiml-reply",
+                "error": None,
+            }
+        )
+        app.logger.info("Replying to %s via TwiML", from_number)
+        return _twiml_response(reply_text)
 
     return Response("OK", mimetype="text/plain")
 
@@ -1092,7 +1525,7 @@ def api_get_auto_reply_config():
 def api_update_auto_reply_config():
     """Update auto-reply toggle and message template."""
 
-    payload = request.get_json(force=True, silent=True) or {}
+    payload = _read_json_object()
     enabled = bool(payload.get("enabled", False))
     message = (payload.get("message") or "").strip()
 
@@ -1297,15 +1730,7 @@ def api_test_ai_connection():
     payload = request.get_json(force=True, silent=True) or {}
     message = (payload.get("message") or "").strip()
     api_key_override = (payload.get("api_key") or "").strip()
-    history_limit_raw = payload.get("history_limit")
-
-    # Safely parse history_limit with explicit None check
-    history_limit = 20  # default
-    if history_limit_raw is not None:
-        try:
-            history_limit = max(1, min(int(history_limit_raw), 200))
-        except (TypeError, ValueError):
-            pass  # Keep default
+    history_limit = _clamp_int(payload.get("history_limit"), default=20, upper=200)
 
     cfg = get_ai_config()
     api_key = api_key_override or (cfg.get("api_key") or "").strip()
@@ -1361,15 +1786,7 @@ def api_ai_send_message():
     participant = (payload.get("participant") or "").strip()
     latest = (payload.get("latest") or "").strip()
     api_key_override = (payload.get("api_key") or "").strip()
-    history_limit_raw = payload.get("history_limit", 20)
-    
-    # Safely parse history_limit with explicit None check
-    history_limit = 20  # default
-    if history_limit_raw is not None:
-        try:
-            history_limit = max(1, min(int(history_limit_raw), 200))
-        except (TypeError, ValueError):
-            pass  # Keep default
+    history_limit = _clamp_int(payload.get("history_limit"), default=20, upper=200)
 
     try:
         result = send_ai_message_to_configured_target(
@@ -1386,7 +1803,7 @@ def api_ai_send_message():
                 direction="outbound",
                 sid=None,
                 to_number=target_number,
-                from_number=current_app.config["TWILIO_SETTINGS"].default_from,
+                from_number=_runtime.twilio_settings.default_from,
                 body=exc.reply_text,
                 status="failed",
                 error=str(exc),
@@ -1412,7 +1829,7 @@ def api_ai_reply_to_inbound():
         return jsonify({"success": False, "error": "Brak odpowiedzi z serwisem news."}), 502
 
     cfg = _load_news_config()
-    cfg["last_test_at"] = datetime.utcnow().isoformat() + "Z"
+    cfg["last_test_at"] = _utc_now_iso()
     cfg = _save_news_config(cfg)
     return jsonify(
         {
@@ -1467,8 +1884,8 @@ def api_ai_reply_to_inbound():
             "to": inbound_from,
             "from": inbound_to,
             "body": reply_text,
-            "sid": getattr(message, "sid", None),
-            "status": getattr(message, "status", None),
+            "sid": message.sid,
+            "status": message.status,
             "model": responder.model,
             "temperature": responder.temperature,
             "history_limit": responder.history_limit,
@@ -1479,11 +1896,7 @@ def api_ai_reply_to_inbound():
 @webhooks_bp.get("/api/ai/conversation")
 def api_get_ai_conversation():
     participant = (request.args.get("participant") or "").strip()
-    limit_raw = request.args.get("limit", "50")
-    try:
-        limit = max(1, min(200, int(limit_raw)))
-    except ValueError:
-        limit = 50
+    limit = _limit_arg(default=50, upper=200)
 
     normalized = ""
     if not participant:
@@ -1504,6 +1917,19 @@ def api_get_ai_conversation():
     return jsonify({"participant": participant, "items": messages})
 
 
+def _reminder_mutation_response(payload: Dict[str, Any], status: int = 200):
+    """
+    Respond to a reminder write with just the changed record.
+
+    The dashboard patches its table from ``item`` / ``deleted``; callers that
+    still want the full list pass ``?include=list``.
+    """
+    if (request.args.get("include") or "").strip().lower() == "list":
+        items = list_scheduled_messages()
+        payload.update(items=items, count=len(items))
+    return jsonify(payload), status
+
+
 @webhooks_bp.get("/api/reminders")
 def api_list_reminders():
     items = list_scheduled_messages()
@@ -1512,7 +1938,7 @@ def api_list_reminders():
 
 @webhooks_bp.post("/api/reminders")
 def api_create_reminder():
-    payload = request.get_json(force=True, silent=True) or {}
+    payload = _read_json_object()
     to_number = (payload.get("to") or "").strip()
     body = (payload.get("body") or "").strip()
     interval_minutes_raw = payload.get("interval_minutes")
@@ -1540,19 +1966,17 @@ def api_create_reminder():
         interval_seconds=interval_seconds,
         enabled=True,
     )
-    items = list_scheduled_messages()
-    return jsonify({"id": sched_id, "items": items, "count": len(items)}), 201
+    return _reminder_mutation_response({"id": sched_id, "item": get_scheduled_message(sched_id)}, 201)
 
 
 @webhooks_bp.post("/api/reminders/<int:sched_id>/toggle")
 def api_toggle_reminder(sched_id: int):
-    payload = request.get_json(force=True, silent=True) or {}
+    payload = _read_json_object()
     enabled = bool(payload.get("enabled", False))
     updated = update_scheduled_message(sched_id=sched_id, enabled=enabled)
     if not updated:
         return jsonify({"error": "Nie znaleziono rekordu."}), 404
-    items = list_scheduled_messages()
-    return jsonify({"items": items, "count": len(items)})
+    return _reminder_mutation_response({"id": sched_id, "item": get_scheduled_message(sched_id)})
 
 
 @webhooks_bp.delete("/api/reminders/<int:sched_id>")
@@ -1560,8 +1984,7 @@ def api_delete_reminder(sched_id: int):
     deleted = delete_scheduled_message(sched_id)
     if not deleted:
         return jsonify({"error": "Nie znaleziono rekordu."}), 404
-    items = list_scheduled_messages()
-    return jsonify({"items": items, "count": len(items)})
+    return _reminder_mutation_response({"id": sched_id, "deleted": True})
 
 
 @webhooks_bp.get("/api/news/config")
@@ -1634,7 +2057,7 @@ def api_add_news_recipient():
         "prompt": prompt,
         "time": time_str,
         "enabled": True,
-        "created_at": datetime.utcnow().isoformat() + "Z",
+        "created_at": _utc_now_iso(),
         "last_sent_at": None,
         "use_all_categories": use_all_categories,
     }
@@ -1805,7 +2228,7 @@ def api_send_news_recipient(recipient_id: int):
         message = f"📰 News:\n\n{response['answer']}"
 
         # Wyślij SMS
-        twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+        twilio_client: TwilioService = _runtime.twilio_client
         origin = twilio_client.settings.default_from
 
         if not origin:
@@ -1824,7 +2247,7 @@ def api_send_news_recipient(recipient_id: int):
             # Aktualizuj last_sent_at
             for r in recipients:
                 if r.get("id") == recipient_id:
-                    r["last_sent_at"] = datetime.utcnow().isoformat() + "Z"
+                    r["last_sent_at"] = _utc_now_iso()
                     break
 
             cfg["recipients"] = recipients
@@ -1868,7 +2291,7 @@ def api_test_news():
         return jsonify({"success": False, "error": "Brak odpowiedzi z serwisu news."}), 502
 
     cfg = _load_news_config()
-    cfg["last_test_at"] = datetime.utcnow().isoformat() + "Z"
+    cfg["last_test_at"] = _utc_now_iso()
     _save_news_config(cfg)
     return jsonify(
         {
@@ -1885,14 +2308,14 @@ def api_test_news():
 def api_news_scrape():
     cfg = _load_news_config()
     svc = ScraperService()
-    started_at = datetime.utcnow().isoformat() + "Z"
+    started_at = _utc_now_iso()
     try:
         results = svc.fetch_all_categories(build_faiss=True)
     except Exception as exc:  # noqa: BLE001
         current_app.logger.exception("News scrape failed: %s", exc)
         return jsonify({"success": False, "error": str(exc)}), 502
 
-    completed_at = datetime.utcnow().isoformat() + "Z"
+    completed_at = _utc_now_iso()
     cfg["last_build_at"] = completed_at
     saved_cfg = _save_news_config(cfg)
 
@@ -1921,7 +2344,7 @@ def api_news_scrape_stream():
     def generate():
         cfg = _load_news_config()
         svc = ScraperService()
-        started_at = datetime.utcnow().isoformat() + "Z"
+        started_at = _utc_now_iso()
 
         # Send initial event with categories list
         categories = list(svc.news_sites.keys())
@@ -1973,7 +2396,7 @@ def api_news_scrape_stream():
         yield f"data: {json.dumps({'type': 'building_faiss'})}\n\n"
         svc._build_faiss_from_results(results)
 
-        completed_at = datetime.utcnow().isoformat() + "Z"
+        completed_at = _utc_now_iso()
         cfg["last_build_at"] = completed_at
         _save_news_config(cfg)
 
@@ -2182,7 +2605,7 @@ def api_news_faiss_export():
     if not available:
         return jsonify({"error": "Brak plików FAISS do zapisania."}), 404
 
-    generated_at = datetime.utcnow().isoformat() + "Z"
+    generated_at = _utc_now_iso()
     buffer = io.BytesIO()
     with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
         files_meta: List[Dict[str, Any]] = []
@@ -2207,7 +2630,7 @@ def api_news_faiss_export():
         )
 
     buffer.seek(0)
-    filename = f"faiss_backup_{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.zip"
+    filename = f"faiss_backup_{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}.zip"
     return send_file(
         buffer,
         mimetype="application/zip",
@@ -2437,7 +2860,7 @@ def api_news_test_faiss():
             
             # Opcjonalna wysyłka SMS
             if send_sms and answer_text:
-                twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+                twilio_client: TwilioService = _runtime.twilio_client
                 
                 # Ustal odbiorcę
                 if not sms_recipient:
@@ -2509,7 +2932,7 @@ def api_news_build_index():
         
         if success:
             cfg = _load_news_config()
-            cfg["last_build_at"] = datetime.utcnow().isoformat() + "Z"
+            cfg["last_build_at"] = _utc_now_iso()
             _save_news_config(cfg)
             
             return jsonify({
@@ -2531,33 +2954,88 @@ def api_news_build_index():
         }), 500
 
 
+def _status_error_from_fields(fields) -> Optional[str]:
+    error_message = fields.get("ErrorMessage")
+    error_code = fields.get("ErrorCode")
+    if error_message:
+        return str(error_message).strip()
+    if error_code:
+        return f"Error code: {error_code}"
+    return None
+
+
+def _parse_status_batch(req) -> Optional[List[Any]]:
+    """Return status entries from a JSON array / NDJSON body, or None if malformed."""
+    if req.mimetype == "application/x-ndjson":
+        try:
+            return [loads_json(line) for line in req.get_data(as_text=True).splitlines() if line.strip()]
+        except ValueError:
+            return None
+    payload = req.get_json(silent=True)
+    if isinstance(payload, dict):
+        return [payload]
+    return payload if isinstance(payload, list) else None
+
+
+def _message_status_batch(app) -> Any:
+    """Apply many status updates posted as JSON array or NDJSON in one write."""
+    entries = _parse_status_batch(request)
+    if entries is None:
+        return jsonify({"status": "error", "message": "Invalid batch payload"}), 400
+
+    updates = []
+    rejected = 0
+    for entry in entries:
+        if not isinstance(entry, dict):
+            rejected += 1
+            continue
+        sid = str(entry.get("MessageSid") or entry.get("SmsSid") or "").strip()
+        status = str(entry.get("MessageStatus") or entry.get("SmsStatus") or "").strip()
+        if not sid or not status:
+            rejected += 1
+            continue
+        updates.append((sid, status, _status_error_from_fields(entry)))
+
+    app.logger.info("Message status batch: %s updates, %s rejected", len(updates), rejected)
+    if updates and not enqueue_status_updates(app._get_current_object(), updates):
+        try:
+            update_message_statuses_bulk(updates)
+        except Exception as exc:  # noqa: BLE001
+            app.logger.exception("Failed to apply status batch: %s", exc)
+            return jsonify({"status": "error", "message": str(exc)}), 500
+
+    return jsonify({"status": "ok", "accepted": len(updates), "rejected": rejected})
+
+
 @webhooks_bp.post("/twilio/status")
 def message_status():
     app = current_app
     if not _validate_twilio_signature(request):
         return jsonify({"status": "forbidden", "message": "Invalid signature"}), 403
 
-    data = request.form.to_dict()
-    app.logger.info("Message status update: %s", data)
-    
-    message_sid = (data.get("MessageSid") or data.get("SmsSid") or "").strip() or None
-    status = (data.get("MessageStatus") or data.get("SmsStatus") or "").strip() or None
+    if request.mimetype in _STATUS_BATCH_MIMETYPES:
+        return _message_status_batch(app)
+
+    form = request.form
+    message_sid = (form.get("MessageSid") or form.get("SmsSid") or "").strip() or None
+    status = (form.get("MessageStatus") or form.get("SmsStatus") or "").strip() or None
+    app.logger.info("Message status update: sid=%s status=%s", message_sid, status)
 
     # Build error message if present
-    error: str | None = None
-    if data.get("ErrorMessage"):
-        error = str(data["ErrorMessage"]).strip()
-    elif data.get("ErrorCode"):
-        error = f"Error code: {data['ErrorCode']}"
+    error = _status_error_from_fields(form)
 
     if not message_sid:
-        app.logger.warning("Received status update without MessageSid: %s", data)
+        if app.logger.isEnabledFor(logging.WARNING):
+            app.logger.warning("Received status update without MessageSid (fields: %s)", list(form.keys()))
         return jsonify({"status": "error", "message": "Missing MessageSid"}), 400
 
     if not status:
         app.logger.warning("Received status update without status for SID %s", message_sid)
         return jsonify({"status": "error", "message": "Missing status"}), 400
 
+    if enqueue_status_update(app._get_current_object(), message_sid, status, error):
+        return jsonify({"status": "ok"})
+
     try:
         updated = update_message_status_by_sid(sid=message_sid, status=status, error=error)
         if updated:
@@ -2571,67 +3049,152 @@ def message_status():
     return jsonify({"status": "ok"})
 
 
-@webhooks_bp.post("/api/send-message")
-def api_send_message():
-    """REST endpoint for sending SMS/MMS messages via Twilio API."""
+def _outbound_send_params(payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Validate one send-message payload into ``TwilioService.send_message`` kwargs.
 
-    payload = request.get_json(force=True, silent=True) or {}
-    
-    # Validate and sanitize input parameters (SMS only)
+    Raises:
+        ValueError: If the recipient or all of body/content/media are missing
+    """
     to = (payload.get("to") or "").strip()
     body = payload.get("body")  # Can be None for MMS-only
 
     content_sid = payload.get("content_sid")
     content_variables = _encode_content_variables(payload.get("content_variables"))
     media_urls = _coerce_media_urls(payload.get("media_urls"))
-    messaging_service_sid = payload.get("messaging_service_sid")
 
     raw_use_ms = payload.get("use_messaging_service")
     use_ms = bool(raw_use_ms) if raw_use_ms is not None else None
 
     if not to:
-        return jsonify({"error": "Field 'to' is required."}), 400
+        raise ValueError("Field 'to' is required.")
 
     if not any([body, content_sid, media_urls]):
-        return jsonify({"error": "Provide at least one of: 'body', 'content_sid', or 'media_urls'."}), 400
+        raise ValueError("Provide at least one of: 'body', 'content_sid', or 'media_urls'.")
+
+    extra_params: Dict[str, Any] = {}
+    if media_urls:
+        extra_params["media_url"] = media_urls
+    if content_sid:
+        extra_params["content_sid"] = content_sid
+    if content_variables:
+        extra_params["content_variables"] = content_variables
+
+    return {
+        "to": to,
+        "body": body or "",
+        "use_messaging_service": use_ms,
+        "messaging_service_sid": payload.get("messaging_service_sid"),
+        "extra_params": extra_params,
+    }
+
+
+def _failed_send_row(params: Mapping[str, Any], origin: Optional[str], exc: Exception) -> Dict[str, Any]:
+    """Message row recording a send that Twilio rejected (no SID)."""
+    return {
+        "direction": "outbound",
+        "sid": None,
+        "to_number": params["to"],
+        "from_number": origin,
+        "body": params["body"],
+        "status": "failed",
+        "error": str(exc),
+    }
+
+
+@webhooks_bp.post("/api/send-message")
+def api_send_message():
+    """REST endpoint for sending SMS/MMS messages via Twilio API."""
 
-    twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+    payload = _read_json_object()
 
+    # Validate and sanitize input parameters (SMS only)
     try:
-        extra_params: Dict[str, Any] = {}
-        if media_urls:
-            extra_params["media_url"] = media_urls
-        if content_sid:
-            extra_params["content_sid"] = content_sid
-        if content_variables:
-            extra_params["content_variables"] = content_variables
-
-        message = twilio_client.send_message(
-            to=to,
-            body=body or "",
-            use_messaging_service=use_ms,
-            messaging_service_sid=messaging_service_sid,
-            extra_params=extra_params,
-        )
+        params = _outbound_send_params(payload)
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
+    twilio_client: TwilioService = _runtime.twilio_client
+
+    try:
+        message = twilio_client.send_message(**params)
     except Exception as exc:  # noqa: BLE001
         current_app.logger.exception("Error while sending message")
-        origin = twilio_client.settings.default_from
-        insert_message(
-            direction="outbound",
-            sid=None,
-            to_number=to,
-            from_number=origin,
-            body=body or "",
-            status="failed",
-            error=str(exc),
-        )
+        # Queued like successful sends, so a Twilio outage does not add a
+        # SQLite commit to every failing request.
+        _persist_message_rows_later([_failed_send_row(params, twilio_client.settings.default_from, exc)])
         return jsonify({"error": str(exc)}), 500
 
-    _persist_twilio_message(message)
+    _persist_twilio_message_later(message)
 
     return jsonify({"sid": message.sid, "status": message.status})
 
 
+MAX_BULK_SEND_ITEMS = 100
+BULK_SEND_CONCURRENCY = 8
+
+
+@webhooks_bp.post("/api/messages/bulk-send")
+def api_bulk_send_messages():
+    """
+    Send several individual messages in one request.
+
+    Request body:
+        messages (list): Up to ``MAX_BULK_SEND_ITEMS`` payloads, each shaped
+            like the ``/api/send-message`` body
+
+    Twilio calls run on up to ``BULK_SEND_CONCURRENCY`` threads sharing the
+    client's keep-alive connection pool; every sent or failed message is then
+    stored in one write-behind batch.
+
+    Returns:
+        JSON ``items`` in request order, each with ``index``, ``to`` and either
+        ``sid``/``status`` or ``error``; plus ``sent`` and ``failed`` counts.
+    """
+    payload = _read_json_object()
+    entries = payload.get("messages")
+    if not isinstance(entries, list) or not entries:
+        return jsonify({"error": "Field 'messages' must be a non-empty list."}), 400
+    if len(entries) > MAX_BULK_SEND_ITEMS:
+        return jsonify({"error": f"At most {MAX_BULK_SEND_ITEMS} messages per request."}), 400
+
+    twilio_client: TwilioService = _runtime.twilio_client
+    origin = twilio_client.settings.default_from
+    items: List[Dict[str, Any]] = [{} for _ in entries]
+    to_send: List[Tuple[int, Dict[str, Any]]] = []
+    for index, entry in enumerate(entries):
+        entry = entry if isinstance(entry, dict) else {}
+        try:
+            params = _outbound_send_params(entry)
+        except ValueError as exc:
+            items[index] = {"index": index, "to": entry.get("to"), "error": str(exc)}
+            continue
+        to_send.append((index, params))
+
+    def send(params: Dict[str, Any]) -> Any:
+        return twilio_client.send_message(**params)
+
+    sent_messages: List[Any] = []
+    failed_rows: List[Dict[str, Any]] = []
+    if to_send:
+        with ThreadPoolExecutor(max_workers=min(BULK_SEND_CONCURRENCY, len(to_send))) as pool:
+            futures = [(index, params, pool.submit(send, params)) for index, params in to_send]
+        for index, params, future in futures:
+            try:
+                message = future.result()
+            except Exception as exc:  # noqa: BLE001
+                current_app.logger.warning("Bulk send to %s failed: %s", params["to"], exc)
+                items[index] = {"index": index, "to": params["to"], "error": str(exc)}
+                failed_rows.append(_failed_send_row(params, origin, exc))
+                continue
+            sent_messages.append(message)
+            items[index] = {"index": index, "to": params["to"], "sid": message.sid, "status": message.status}
+
+    _persist_message_rows_later([_twilio_message_row(message) for message in sent_messages] + failed_rows)
+
+    return jsonify({"items": items, "sent": len(sent_messages), "failed": len(entries) - len(sent_messages)})
+
+
 @webhooks_bp.post("/api/multi-sms/batches")
 def api_create_multi_sms_batch():
     payload = request.get_json(force=True, silent=True) or {}
@@ -2648,7 +3211,7 @@ def api_create_multi_sms_batch():
     if len(recipients) > max_recipients:
         return jsonify({"error": f"Maksymalnie {max_recipients} odbiorców na jedno zadanie."}), 400
 
-    settings = current_app.config["TWILIO_SETTINGS"]
+    settings = _runtime.twilio_settings
     has_sender = bool(
         (settings.default_from and settings.default_from.strip())
         or (settings.messaging_service_sid and settings.messaging_service_sid.strip())
@@ -2671,13 +3234,9 @@ def api_create_multi_sms_batch():
 
 @webhooks_bp.get("/api/multi-sms/batches")
 def api_list_multi_sms_batches():
-    limit_raw = request.args.get("limit", "20")
-    try:
-        limit = max(1, min(int(limit_raw), 200))
-    except ValueError:
-        limit = 20
+    limit = _limit_arg(default=20, upper=200)
 
-    include_recipients = (request.args.get("include_recipients") or "").strip().lower() in {"1", "true", "yes", "y"}
+    include_recipients = (request.args.get("include_recipients") or "").strip().lower() in _TRUTHY_ARG_VALUES
 
     items = list_multi_sms_batches(limit=limit)
     if include_recipients:
@@ -2714,16 +3273,44 @@ def api_multi_sms_batch_recipients(batch_id: int):
 
 @webhooks_bp.get("/api/messages")
 def api_messages():
-    limit_raw = request.args.get("limit", "50")
-    try:
-        limit = max(1, min(int(limit_raw), 500))
-    except ValueError:
-        limit = 50
+    limit = _limit_arg(default=50, upper=500)
 
-    direction = request.args.get("direction")
+    try:
+        direction = _direction_arg()
+        cursor = _cursor_arg()
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
     _maybe_sync_messages(limit=limit)
-    messages = list_messages(limit=limit, direction=direction)
-    return jsonify({"items": messages, "count": len(messages)})
+    return _stream_items_response(
+        iter_messages(limit=limit, direction=direction, before=cursor),
+        page_size=limit,
+    )
+
+
+MAX_NDJSON_EXPORT_LIMIT = 5000
+
+
+@webhooks_bp.get("/api/messages.ndjson")
+def api_messages_ndjson():
+    """
+    Export stored messages as newline-delimited JSON, one message per line.
+
+    Rows are read from the cursor in batches and written as they arrive, so
+    large exports (up to ``MAX_NDJSON_EXPORT_LIMIT``) never sit in memory.
+    """
+    limit = _limit_arg(default=500, upper=MAX_NDJSON_EXPORT_LIMIT)
+
+    try:
+        direction = _direction_arg()
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+    _maybe_sync_messages()
+
+    def generate() -> Iterator[bytes]:
+        for row in iter_messages(limit=limit, direction=direction, batch_size=200):
+            yield dumps_json_bytes(row) + b"\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
 
 
 @webhooks_bp.post("/api/messages")
@@ -2757,7 +3344,7 @@ def api_messages_send():
         return jsonify({"success": False, "error": "Nieprawidłowy format numeru telefonu."}), 400
     
     try:
-        twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+        twilio_client: TwilioService = _runtime.twilio_client
         
         # Automatycznie użyj send_chunked_sms() dla długich wiadomości
         if len(body) > MAX_SMS_CHARS:
@@ -2828,11 +3415,7 @@ def api_conversations():
         - message_count: Total messages in conversation
         - last_message: Object with body, direction, status, created_at
     """
-    limit_raw = request.args.get("limit", "30")
-    try:
-        limit = max(1, min(int(limit_raw), 200))
-    except ValueError:
-        limit = 30
+    limit = _limit_arg(default=30, upper=200)
 
     raw_conversations = list_conversations(limit=limit)
     
@@ -2868,13 +3451,21 @@ def api_conversation_detail(participant: str):
     else:
         query_kwargs = {"participant": normalized_participant}
 
+    try:
+        cursor = _cursor_arg()
+    except ValueError as exc:
+        return jsonify({"error": str(exc)}), 400
+
     _maybe_sync_messages(limit=CHAT_HISTORY_LIMIT)
-    messages = list_messages(limit=CHAT_HISTORY_LIMIT, ascending=True, **query_kwargs)
+    messages = list_messages(limit=CHAT_HISTORY_LIMIT, ascending=True, before=cursor, **query_kwargs)
+    # Oldest message first; its cursor loads the previous page of history
+    next_cursor = _message_cursor(messages[0]) if len(messages) >= CHAT_HISTORY_LIMIT else None
     return jsonify(
         {
             "participant": normalized_participant,
             "items": messages,
             "count": len(messages),
+            "next_cursor": next_cursor,
         }
     )
 
@@ -2883,16 +3474,14 @@ def api_conversation_detail(participant: str):
 def api_messages_stats():
     _maybe_sync_messages(limit=50)
     stats = get_message_stats()
+    # Last successful Twilio sync by this process (None until one completes)
+    stats["synced_at"] = current_app.config.get("TWILIO_SYNC_CACHE", {}).get("synced_at")
     return jsonify(stats)
 
 
 @webhooks_bp.get("/api/messages/remote")
 def api_remote_messages():
-    limit_raw = request.args.get("limit", "20")
-    try:
-        limit = max(1, min(int(limit_raw), 100))
-    except ValueError:
-        limit = 20
+    limit = _limit_arg(default=20, upper=100)
 
     filters: Dict[str, Any] = {"limit": limit}
     to_filter = request.args.get("to")
@@ -2912,57 +3501,127 @@ def api_remote_messages():
     if date_sent_after:
         filters["date_sent_after"] = date_sent_after
 
-    twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+    twilio_client: TwilioService = _runtime.twilio_client
     try:
-        remote_messages = twilio_client.list_messages(**filters)
+        remote_iter = iter(twilio_client.stream_messages(**filters))
+        # Pull the first page now so Twilio errors still map to a 500 response
+        first = next(remote_iter, None)
     except Exception as exc:  # noqa: BLE001
         current_app.logger.exception("Unable to list messages")
         return jsonify({"error": str(exc)}), 500
 
-    items = []
-    first_inbound_enqueued = False
-    for message in remote_messages:
-        _persist_twilio_message(message)
+    full = (request.args.get("full") or "").strip().lower() in _TRUTHY_ARG_VALUES
+    return _stream_items_response(_stream_remote_messages(first, remote_iter, full=full))
 
-        # Enqueue auto-reply for the newest inbound message only (remote list is newest-first)
-        if not first_inbound_enqueued and (getattr(message, "direction", "") or "").startswith("inbound"):
-            _maybe_enqueue_auto_reply_for_message(message)
-            first_inbound_enqueued = True
 
-        items.append(_twilio_message_to_dict(message))
+REMOTE_PERSIST_BATCH_SIZE = 200
 
-    return jsonify({"items": items, "count": len(items)})
+
+def _stream_remote_messages(
+    first: Any, remote_iter: Iterator[Any], full: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield API dicts for remote messages while queueing their upserts in batches.
+
+    Items use the compact summary shape unless ``full`` is set.
+
+    Serialisation of earlier messages overlaps with fetching later Twilio
+    pages. Rows go to the write-behind queue (written inline only when no
+    persistence worker runs), so the listing never waits on SQLite. At the
+    end, recent inbound messages are queued for auto-reply, as in the
+    history sync path.
+    """
+    if first is None:
+        return
+
+    buffer: List[Any] = []
+    inbound: List[Any] = []
+    try:
+        for message in itertools.chain((first,), remote_iter):
+            if _is_inbound(message):
+                inbound.append(message)
+            buffer.append(message)
+            if len(buffer) >= REMOTE_PERSIST_BATCH_SIZE:
+                _persist_twilio_messages_later(buffer)
+                buffer.clear()
+            yield _twilio_message_to_dict(message, full=full)
+    finally:
+        if buffer:
+            _persist_twilio_messages_later(buffer)
+
+    _enqueue_auto_replies_for_recent_inbound(inbound)
 
 
 @webhooks_bp.get("/api/messages/<sid>")
 def api_message_detail(sid: str):
-    twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+    twilio_client: TwilioService = _runtime.twilio_client
     try:
         message = twilio_client.fetch_message(sid)
     except Exception as exc:  # noqa: BLE001
         current_app.logger.exception("Unable to fetch message %s", sid)
         return jsonify({"error": str(exc)}), 404
 
-    _persist_twilio_message(message)
+    _persist_twilio_message_later(message)
     return jsonify({"item": _twilio_message_to_dict(message)})
 
 
+MAX_BATCH_SUBREQUESTS = 32
+
+
+@webhooks_bp.post("/api/batch")
+def api_batch():
+    """
+    Run several read-only API calls in one round trip.
+
+    Request body:
+        requests (list): Sub-requests like ``{"method": "GET", "path": "/api/messages/SM..."}``
+            (at most ``MAX_BATCH_SUBREQUESTS``; only GET on ``/api/`` paths)
+
+    Returns:
+        JSON ``items`` with ``path``, ``status`` and parsed ``body`` per sub-request, in order.
+    """
+    payload = _read_json_object()
+    sub_requests = payload.get("requests")
+    if not isinstance(sub_requests, list) or not sub_requests:
+        return jsonify({"error": "Pole 'requests' musi być niepustą listą."}), 400
+    if len(sub_requests) > MAX_BATCH_SUBREQUESTS:
+        return jsonify({"error": f"Maksymalnie {MAX_BATCH_SUBREQUESTS} zapytań w jednym batchu."}), 400
+
+    client = current_app.test_client()
+    items = []
+    for entry in sub_requests:
+        entry = entry if isinstance(entry, dict) else {}
+        method = str(entry.get("method") or "GET").upper()
+        path = str(entry.get("path") or "")
+        if method != "GET" or not path.startswith("/api/") or path.startswith("/api/batch"):
+            items.append({"path": path, "status": 400, "body": {"error": "Dozwolone są tylko zapytania GET do /api/."}})
+            continue
+
+        sub_response = client.get(path, environ_base={"REMOTE_ADDR": request.remote_addr})
+        body = sub_response.get_json(silent=True)
+        if body is None:
+            body = sub_response.get_data(as_text=True)
+        items.append({"path": path, "status": sub_response.status_code, "body": body})
+
+    return jsonify({"items": items, "count": len(items)})
+
+
 @webhooks_bp.post("/api/messages/<sid>/redact")
 def api_redact_message(sid: str):
-    twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+    twilio_client: TwilioService = _runtime.twilio_client
     try:
         message = twilio_client.redact_message(sid)
     except Exception as exc:  # noqa: BLE001
         current_app.logger.exception("Unable to redact message %s", sid)
         return jsonify({"error": str(exc)}), 400
 
-    _persist_twilio_message(message)
+    _persist_twilio_message_later(message)
     return jsonify({"sid": message.sid, "body": message.body, "status": message.status})
 
 
 @webhooks_bp.delete("/api/messages/<sid>")
 def api_delete_message(sid: str):
-    twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+    twilio_client: TwilioService = _runtime.twilio_client
     try:
         remote_deleted = twilio_client.delete_message(sid)
     except Exception as exc:  # noqa: BLE001
@@ -2973,6 +3632,7 @@ def api_delete_message(sid: str):
         current_app.logger.warning("Twilio did not confirm deletion for SID %s", sid)
         return jsonify({"error": "Twilio nie potwierdziło usunięcia wiadomości."}), 502
 
+    wait_for_pending_writes(current_app._get_current_object())
     deleted_local = delete_message_by_sid(sid)
     return jsonify({
         "sid": sid,
@@ -3012,7 +3672,7 @@ def api_delete_conversation(participant: str):
             409,
         )
 
-    twilio_client: TwilioService = current_app.config["TWILIO_CLIENT"]
+    twilio_client: TwilioService = _runtime.twilio_client
     failed: List[Dict[str, Any]] = []
     for ref in message_refs:
         sid = ref.get("sid")
@@ -3044,6 +3704,7 @@ def api_delete_conversation(participant: str):
             502,
         )
 
+    wait_for_pending_writes(current_app._get_current_object())
     deleted_local = delete_conversation_messages(
         participant=participant_value,
         participant_normalized=normalized_value or None,
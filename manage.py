@@ -10,13 +10,17 @@ Provides CLI commands for:
 from __future__ import annotations
 
 import argparse
+import json
+import random
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
-from app import create_app
-from app.twilio_client import TwilioService
-from app.database import get_ai_config, insert_message
-from app.ai_service import AIResponder
-from app.exceptions import TwilioChatError
+# The app package pulls in Flask, the Twilio SDK and OpenAI; it is imported
+# only once a subcommand is known so ``--help`` and argument errors stay fast.
+if TYPE_CHECKING:
+    from app.twilio_client import TwilioService
 
 
 def main() -> int:
@@ -34,6 +38,9 @@ Examples:
   # Send a simple SMS
   python manage.py send --to +48123456789 --body "Hello from CLI"
   
+  # Send many messages from a JSONL file ({"to": ..., "body": ...} per line)
+  python manage.py bulk-send --file messages.jsonl --concurrency 8
+
   # Send AI-generated message
   python manage.py ai-send --to +48123456789 --latest "Hi there"
         """,
@@ -60,6 +67,34 @@ Examples:
         action="store_true",
         help="Use Messaging Service SID instead of default from number",
     )
+    send_parser.add_argument(
+        "--no-flask",
+        action="store_true",
+        help="Send with a bare Twilio client from the environment, skipping app start-up "
+        "(database, blueprints, background workers)",
+    )
+
+    # bulk-send command
+    bulk_send_parser = subparsers.add_parser(
+        "bulk-send",
+        help="Send many messages listed in a JSONL file via Twilio",
+    )
+    bulk_send_parser.add_argument(
+        "--file",
+        required=True,
+        help='JSONL file with one {"to": "+48...", "body": "..."} object per line ("-" for stdin)',
+    )
+    bulk_send_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Number of messages sent in parallel (default: 8)",
+    )
+    bulk_send_parser.add_argument(
+        "--use-messaging-service",
+        action="store_true",
+        help="Use Messaging Service SID instead of default from number",
+    )
 
     # ai-send command
     ai_send_parser = subparsers.add_parser(
@@ -80,6 +115,17 @@ Examples:
         default=20,
         help="Number of recent messages to include when building AI context (default: 20)",
     )
+    ai_send_parser.add_argument(
+        "--batch",
+        help='JSONL file with one {"to": "+48...", "latest": "..."} object per line; '
+        'replies are generated and sent concurrently ("-" for stdin)',
+    )
+    ai_send_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Number of replies generated in parallel with --batch (default: 4, max: 16)",
+    )
     ai_send_parser.add_argument(
         "--use-messaging-service",
         action="store_true",
@@ -92,15 +138,25 @@ Examples:
         parser.print_help()
         return 1
 
-    app = create_app()
+    from app.exceptions import TwilioChatError
 
     try:
+        if args.command == "send" and args.no_flask:
+            return handle_send(_standalone_twilio_client(), args)
+
+        from app import create_app
+
+        app = create_app()
+
         with app.app_context():
             twilio_client: TwilioService = app.config["TWILIO_CLIENT"]
 
             if args.command == "send":
                 return handle_send(twilio_client, args)
 
+            if args.command == "bulk-send":
+                return handle_bulk_send(twilio_client, args)
+
             if args.command == "ai-send":
                 return handle_ai_send(twilio_client, args)
 
@@ -117,6 +173,15 @@ Examples:
     return 0
 
 
+def _standalone_twilio_client() -> TwilioService:
+    """Twilio service built straight from environment settings, without the Flask app."""
+    from app.config import get_settings
+    from app.twilio_client import TwilioService
+
+    _, twilio_settings, _ = get_settings()
+    return TwilioService(twilio_settings)
+
+
 def handle_send(twilio_client: TwilioService, args: argparse.Namespace) -> int:
     """Handle 'send' command."""
     message = twilio_client.send_message(
@@ -128,10 +193,106 @@ def handle_send(twilio_client: TwilioService, args: argparse.Namespace) -> int:
     return 0
 
 
+def _read_jsonl(path: str) -> list[dict]:
+    """Load one JSON object per non-empty line (``-`` reads stdin)."""
+    handle = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        rows = []
+        for line_no, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            row = json.loads(line)
+            if not isinstance(row, dict):
+                raise ValueError(f"Line {line_no}: expected a JSON object")
+            rows.append(row)
+        return rows
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def _read_bulk_rows(path: str) -> list[dict]:
+    """Load ``to``/``body`` pairs for 'bulk-send'."""
+    rows = []
+    for index, row in enumerate(_read_jsonl(path), start=1):
+        to = str(row.get("to") or "").strip()
+        body = str(row.get("body") or "").strip()
+        if not to or not body:
+            raise ValueError(f"Entry {index}: both 'to' and 'body' are required")
+        rows.append({"to": to, "body": body})
+    return rows
+
+
+def _outbound_record(to: str, body: str, origin: str | None, message=None, exc: Exception | None = None) -> dict:
+    """Message row for ``upsert_messages_bulk``; a failed send has ``exc`` and no message."""
+    if exc is not None:
+        return {
+            "direction": "outbound",
+            "sid": None,
+            "to_number": to,
+            "from_number": origin,
+            "body": body,
+            "status": "failed",
+            "error": str(exc),
+        }
+    return {
+        "direction": "outbound",
+        "sid": getattr(message, "sid", None),
+        "to_number": to,
+        "from_number": getattr(message, "from_", None) or origin,
+        "body": body,
+        "status": getattr(message, "status", None),
+        "error": None,
+    }
+
+
+def handle_bulk_send(twilio_client: TwilioService, args: argparse.Namespace) -> int:
+    """Handle 'bulk-send' command."""
+    from app.database import upsert_messages_bulk
+
+    rows = _read_bulk_rows(args.file)
+    if not rows:
+        print("Nothing to send.")
+        return 0
+
+    def send(row: dict):
+        return twilio_client.send_message(
+            to=row["to"],
+            body=row["body"],
+            use_messaging_service=args.use_messaging_service,
+        )
+
+    # One app context and one Twilio client; the HTTPS round trips overlap
+    # across worker threads sharing the client's connection pool.
+    with ThreadPoolExecutor(max_workers=max(1, min(args.concurrency, len(rows)))) as pool:
+        futures = [(row, pool.submit(send, row)) for row in rows]
+
+    origin = twilio_client.settings.default_from
+    records = []
+    failed = 0
+    for row, future in futures:
+        try:
+            message = future.result()
+        except Exception as exc:  # noqa: BLE001
+            failed += 1
+            print(f"❌ {row['to']}: {exc}", file=sys.stderr)
+            records.append(_outbound_record(row["to"], row["body"], origin, exc=exc))
+            continue
+        print(f"✅ {row['to']}: SID={message.sid}, Status={message.status}")
+        records.append(_outbound_record(row["to"], row["body"], origin, message))
+
+    upsert_messages_bulk(records)
+
+    print(f"Sent {len(rows) - failed}/{len(rows)} messages.")
+    return 1 if failed else 0
+
+
 def handle_ai_send(twilio_client: TwilioService, args: argparse.Namespace) -> int:
     """Handle 'ai-send' command."""
+    from app.ai_service import AIResponder
+    from app.database import get_ai_config, insert_message
     from app.exceptions import ConfigurationError
-    
+
     cfg = get_ai_config()
     api_key = (cfg.get("api_key") or "").strip()
     if not api_key:
@@ -139,20 +300,26 @@ def handle_ai_send(twilio_client: TwilioService, args: argparse.Namespace) -> in
             "Brak zapisanego klucza OpenAI. Ustaw OPENAI_API_KEY lub zapisz go w panelu."
         )
 
-    target_number = (args.to or cfg.get("target_number") or "").strip()
-    if not target_number:
-        raise ConfigurationError(
-            "Podaj numer odbiorcy (--to) lub skonfiguruj AI target w panelu."
-        )
-
     responder = AIResponder(
         api_key=api_key,
         model=(cfg.get("model") or "gpt-4o-mini").strip(),
         system_prompt=cfg.get("system_prompt") or "",
         temperature=float(cfg.get("temperature", 0.7) or 0.7),
         history_limit=max(1, args.history_limit),
+        # The batch path retries rate limits itself (_build_reply_with_retry);
+        # SDK retries underneath would multiply the calls per row.
+        max_retries=0 if args.batch else None,
     )
 
+    if args.batch:
+        return _handle_ai_send_batch(twilio_client, responder, args)
+
+    target_number = (args.to or cfg.get("target_number") or "").strip()
+    if not target_number:
+        raise ConfigurationError(
+            "Podaj numer odbiorcy (--to) lub skonfiguruj AI target w panelu."
+        )
+
     print(f"🤖 Generating AI reply for {target_number}...")
     reply = responder.build_reply(
         participant=target_number,
@@ -183,8 +350,93 @@ def handle_ai_send(twilio_client: TwilioService, args: argparse.Namespace) -> in
     return 0
 
 
-if __name__ == "__main__":
-    sys.exit(main())
+AI_BATCH_MAX_CONCURRENCY = 16  # upper bound for --concurrency; more only trips OpenAI rate limits
+AI_BATCH_RETRIES = 3
+AI_BATCH_RETRY_BASE_DELAY = 1.0  # seconds; doubles per attempt, randomized up to 2x
+
+
+def _is_retryable_ai_error(exc: Exception) -> bool:
+    """True when an AIServiceError wraps an OpenAI 429 or 5xx response."""
+    from openai import APIStatusError, RateLimitError
+
+    cause = exc.__cause__
+    if isinstance(cause, RateLimitError):
+        return True
+    return isinstance(cause, APIStatusError) and cause.status_code >= 500
+
+
+def _build_reply_with_retry(responder, participant: str, latest: str | None) -> str:
+    """Call ``responder.build_reply`` with jittered exponential backoff on rate limits and 5xx."""
+    from app.exceptions import AIServiceError
+
+    delay = AI_BATCH_RETRY_BASE_DELAY
+    for _ in range(AI_BATCH_RETRIES):
+        try:
+            return responder.build_reply(participant=participant, latest_user_message=latest)
+        except AIServiceError as exc:
+            if not _is_retryable_ai_error(exc):
+                raise
+        # Jitter keeps throttled workers from retrying in lockstep
+        time.sleep(random.uniform(delay, delay * 2))
+        delay *= 2
+    return responder.build_reply(participant=participant, latest_user_message=latest)
+
+
+def _handle_ai_send_batch(twilio_client: TwilioService, responder, args: argparse.Namespace) -> int:
+    """Generate and send AI replies for every entry of ``--batch`` concurrently."""
+    from flask import current_app
+
+    from app.database import upsert_messages_bulk
+    from app.exceptions import ConfigurationError
+
+    rows = []
+    for index, row in enumerate(_read_jsonl(args.batch), start=1):
+        to = str(row.get("to") or "").strip()
+        if not to:
+            raise ValueError(f"Entry {index}: 'to' is required")
+        latest = row.get("latest")
+        rows.append({"to": to, "latest": str(latest) if latest else None})
+    if not rows:
+        print("Nothing to send.")
+        return 0
+
+    app = current_app._get_current_object()
+
+    def generate_and_send(row: dict):
+        # Each worker needs its own app context (and so its own DB connection)
+        # for the history lookup; the OpenAI and Twilio clients are shared.
+        with app.app_context():
+            reply = _build_reply_with_retry(responder, row["to"], row["latest"])
+            if not reply:
+                raise ConfigurationError("AI nie zwróciła treści wiadomości.")
+            message = twilio_client.send_message(
+                to=row["to"],
+                body=reply,
+                use_messaging_service=args.use_messaging_service,
+            )
+            return reply, message
+
+    print(f"🤖 Generating AI replies for {len(rows)} recipients...")
+    workers = max(1, min(args.concurrency, AI_BATCH_MAX_CONCURRENCY, len(rows)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [(row, pool.submit(generate_and_send, row)) for row in rows]
+
+    origin = twilio_client.settings.default_from
+    records = []
+    for row, future in futures:
+        try:
+            reply, message = future.result()
+        except Exception as exc:  # noqa: BLE001
+            print(f"❌ {row['to']}: {getattr(exc, 'message', exc)}", file=sys.stderr)
+            continue
+        print(f"✅ {row['to']}: SID={message.sid}")
+        records.append(_outbound_record(row["to"], reply, origin, message))
+
+    upsert_messages_bulk(records)
+
+    print(f"Sent {len(records)}/{len(rows)} AI messages.")
+    return 0 if len(records) == len(rows) else 1
+
 
 if __name__ == "__main__":
     sys.exit(main())
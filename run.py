@@ -20,9 +20,12 @@ if __name__ == "__main__":
     
     # Wyłączamy reloader w dev, aby uniknąć podwójnego startu workerów oraz
     # sytuacji, w której pierwszy proces kończy się przed pełnym rozruchem.
+    # Serwer obsługuje każde żądanie w osobnym wątku, więc seria webhooków
+    # Twilio nie czeka na wolne zapytania do panelu.
     app.run(
         host=settings.host,
         port=settings.port,
         debug=settings.debug,
         use_reloader=False,
+        threaded=True,
     )
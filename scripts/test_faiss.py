@@ -6,6 +6,8 @@ Optionally set SECOND_OPENAI for real embeddings and chat:
     export SECOND_OPENAI="sk-..."
 """
 
+import hashlib
+import json
 import os
 import sys
 
@@ -13,7 +15,13 @@ ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if ROOT not in sys.path:
     sys.path.insert(0, ROOT)
 
-from app.faiss_service import FAISSService
+from app.faiss_service import (
+    DATA_DIR,
+    FAISSService,
+    _get_chunk_params,
+    _get_embedding_model,
+    save_faiss_index,
+)
 from app.scraper_service import ScraperService
 
 
@@ -24,9 +32,27 @@ def main() -> None:
         "Technologie": "Nowa firma AI otrzymala finansowanie na rozwijanie modeli językowych.",
     }
 
+    # Reuse the index built for this exact dataset on a previous run instead of
+    # re-embedding it; the cache key changes whenever the synthetic texts, the
+    # embedding model or the chunking parameters do.
+    chunk_size, chunk_overlap = _get_chunk_params()
+    cache_input = {
+        "data": synthetic,
+        "embedding_model": _get_embedding_model(),
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+    }
+    key = hashlib.blake2b(json.dumps(cache_input, sort_keys=True).encode("utf-8"), digest_size=8).hexdigest()
+    cache_path = os.path.join(DATA_DIR, "faiss_test_cache", key)
+
     faiss_service = FAISSService()
-    ok = faiss_service.build_index_from_scraped_content(synthetic)
-    print(f"Index build (synthetic) ok={ok}")
+    if faiss_service.load_index(cache_path):
+        print(f"Index loaded from cache {cache_path}")
+    else:
+        ok = faiss_service.build_index_from_scraped_content(synthetic)
+        print(f"Index build (synthetic) ok={ok}")
+        if ok:
+            save_faiss_index(faiss_service.vector_store, cache_path)
 
     # 2) Local search
     search_res = faiss_service.search("Co nowego w gospodarce?", top_k=3)
@@ -0,0 +1,42 @@
+import httpx
+import pytest
+from openai import OpenAI
+
+import manage
+from app import ai_service
+from app.ai_service import AIResponder
+from app.exceptions import AIServiceError
+
+
+@pytest.fixture()
+def throttled_openai(monkeypatch):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(429, json={"error": {"message": "rate limited", "type": "rate_limit"}})
+
+    client = OpenAI(api_key="sk-test", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(ai_service, "get_openai_client", lambda api_key: client)
+    monkeypatch.setattr(manage, "AI_BATCH_RETRY_BASE_DELAY", 0.0)
+    return calls
+
+
+def _responder(**kwargs):
+    return AIResponder(api_key="sk-test", model="gpt-4o-mini", system_prompt="", temperature=0.5, **kwargs)
+
+
+def test_batch_retry_is_the_only_retry_layer(app, throttled_openai):
+    responder = _responder(max_retries=0)
+    with app.app_context(), pytest.raises(AIServiceError):
+        manage._build_reply_with_retry(responder, "+48111000001", "hello")
+
+    assert len(throttled_openai) == manage.AI_BATCH_RETRIES + 1
+
+
+def test_responder_without_override_keeps_sdk_retries(app, throttled_openai, monkeypatch):
+    monkeypatch.setattr("openai._base_client.BaseClient._calculate_retry_timeout", lambda *a, **k: 0)
+    with app.app_context(), pytest.raises(AIServiceError):
+        _responder().build_reply("+48111000001", "hello")
+
+    assert len(throttled_openai) == 3  # SDK default: 1 attempt + 2 retries
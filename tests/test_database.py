@@ -0,0 +1,65 @@
+from app.database import get_message_stats, upsert_message
+
+
+def _upsert(sid, direction="inbound", body="hello"):
+    return upsert_message(
+        sid=sid,
+        direction=direction,
+        to_number="+15550001111",
+        from_number="+48111000001",
+        body=body,
+        status="received",
+        error=None,
+    )
+
+
+def test_upsert_new_sid_refreshes_cached_stats(app):
+    with app.app_context():
+        before = get_message_stats()
+        _upsert("SMnew0001")
+        after = get_message_stats()
+
+    assert after["total"] == before["total"] + 1
+    assert after["inbound"] == before["inbound"] + 1
+
+
+def _query_plan(conn, **filters):
+    from app.database import _messages_query
+
+    query, params = _messages_query(
+        50, None, filters.get("participant"), filters.get("participant_normalized"), filters.get("before")
+    )
+    return " | ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + query, params))
+
+
+def test_conversation_query_searches_normalized_participant_indexes(app):
+    from app.database import _get_connection
+
+    with app.app_context():
+        conn = _get_connection()
+        plan = _query_plan(conn, participant_normalized="+48111000001")
+        paged = _query_plan(conn, participant_normalized="+48111000001", before=("2025-01-01 10:00:00", 10))
+
+    for text in (plan, paged):
+        assert "MULTI-INDEX OR" in text
+        assert "idx_messages_to_normalized" in text
+        assert "idx_messages_from_normalized" in text
+
+
+def test_schema_upgrade_replaces_raw_participant_indexes(app):
+    from app.database import _ensure_schema, _get_connection
+
+    with app.app_context():
+        conn = _get_connection()
+        conn.execute("DROP INDEX idx_messages_to_normalized")
+        conn.execute("DROP INDEX idx_messages_from_normalized")
+        conn.execute("CREATE INDEX idx_messages_to_created_dt ON messages(to_number, datetime(created_at), id)")
+        conn.execute("CREATE INDEX idx_messages_from_created_dt ON messages(from_number, datetime(created_at), id)")
+        conn.execute("PRAGMA user_version = 12")
+        conn.commit()
+
+        _ensure_schema()
+        names = {row["name"] for row in conn.execute("PRAGMA index_list('messages')")}
+
+    assert {"idx_messages_to_normalized", "idx_messages_from_normalized"} <= names
+    assert not {"idx_messages_to_created_dt", "idx_messages_from_created_dt"} & names
@@ -0,0 +1,15 @@
+from app.json_provider import OrjsonProvider
+from app.json_utils import dumps, loads
+
+
+def test_dumps_round_trip_keeps_unicode():
+    payload = {"body": "zażółć", "count": 2}
+    assert loads(dumps(payload)) == payload
+    assert "zażółć" in dumps(payload)
+
+
+def test_app_uses_orjson_provider(app, client):
+    assert isinstance(app.json, OrjsonProvider)
+    response = client.get("/api/health")
+    assert response.status_code == 200
+    assert response.get_json()["status"] == "ok"
@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Runs in a fresh interpreter: the test session itself has Flask loaded.
+_NO_FLASK_SEND = """
+import sys
+import app.twilio_client as twilio_client
+
+class Message:
+    sid = "SM123"
+    status = "queued"
+
+twilio_client.TwilioService.send_message = lambda self, **kwargs: Message()
+
+import manage
+
+sys.argv = ["manage.py", "send", "--to", "+48111000001", "--body", "hi", "--no-flask"]
+code = manage.main()
+print("exit", code)
+print("flask loaded", "flask" in sys.modules)
+print("werkzeug loaded", "werkzeug" in sys.modules)
+"""
+
+
+def test_no_flask_send_does_not_import_flask(tmp_path):
+    env = dict(os.environ, DB_PATH=str(tmp_path / "app.db"))
+    result = subprocess.run(
+        [sys.executable, "-c", _NO_FLASK_SEND],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert "exit 0" in result.stdout, result.stderr
+    assert "SID=SM123" in result.stdout
+    assert "flask loaded False" in result.stdout
+    assert "werkzeug loaded False" in result.stdout
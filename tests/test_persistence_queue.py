@@ -0,0 +1,62 @@
+import threading
+from queue import Queue
+
+from app.database import _get_connection
+from app.persistence_queue import (
+    enqueue_message_rows,
+    enqueue_status_update,
+    start_persistence_worker,
+    stop_persistence_worker,
+)
+
+
+def _row(sid, status="received"):
+    return {
+        "sid": sid,
+        "direction": "inbound",
+        "to_number": "+15550001111",
+        "from_number": "+48111000001",
+        "body": f"body {sid}",
+        "status": status,
+        "error": None,
+    }
+
+
+def get_message_by_sid(sid):
+    row = _get_connection().execute("SELECT sid, status FROM messages WHERE sid = ?", (sid,)).fetchone()
+    return dict(row) if row else None
+
+
+def test_shutdown_hook_flushes_items_the_worker_never_took(app):
+    # A live thread that never reads the queue stands in for a busy worker.
+    release = threading.Event()
+    idle = threading.Thread(target=release.wait, daemon=True)
+    idle.start()
+    app.config["PERSISTENCE_THREAD"] = idle
+    app.config["PERSISTENCE_STOP"] = threading.Event()
+    app.config["PERSISTENCE_QUEUE"] = Queue()
+    try:
+        assert enqueue_message_rows(app, [_row("SMq1"), _row("SMq2")])
+        assert enqueue_status_update(app, "SMq1", "delivered")
+
+        stop_persistence_worker(app, timeout=0.1)
+    finally:
+        release.set()
+
+    with app.app_context():
+        first = get_message_by_sid("SMq1")
+        second = get_message_by_sid("SMq2")
+    assert first is not None and first["status"] == "delivered"
+    assert second is not None
+    assert not enqueue_message_rows(app, [_row("SMq3")])
+
+
+def test_shutdown_hook_stops_running_worker(app):
+    start_persistence_worker(app)
+    assert enqueue_message_rows(app, [_row(f"SMw{i}") for i in range(5)])
+
+    stop_persistence_worker(app)
+
+    assert not app.config["PERSISTENCE_THREAD"].is_alive()
+    with app.app_context():
+        assert all(get_message_by_sid(f"SMw{i}") is not None for i in range(5))
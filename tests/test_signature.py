@@ -0,0 +1,62 @@
+import base64
+import hashlib
+import hmac
+
+import pytest
+
+from app import webhooks
+
+
+def _sign(url: str, params: dict, token: str = "test-token") -> str:
+    payload = url + "".join(name + params[name] for name in sorted(params))
+    digest = hmac.new(token.encode("utf-8"), payload.encode("utf-8"), hashlib.sha1).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+@pytest.fixture()
+def validating(monkeypatch):
+    monkeypatch.setattr(webhooks, "_SIGNATURE_VALIDATION_DISABLED", False)
+
+
+@pytest.mark.parametrize("path", ["/twilio/status", "/twilio/inbound"])
+def test_signed_json_body_without_body_sha256_is_forbidden(client, validating, path):
+    url = "http://localhost" + path
+    response = client.post(
+        path,
+        data='[{"MessageSid": "SM1", "MessageStatus": "delivered"}]',
+        content_type="application/json",
+        headers={"X-Twilio-Signature": _sign(url, {})},
+    )
+    assert response.status_code == 403
+
+
+def test_missing_signature_is_forbidden(client, validating):
+    response = client.post("/twilio/status", data={"MessageSid": "SM1", "MessageStatus": "sent"})
+    assert response.status_code == 403
+
+
+def test_valid_form_signature_is_accepted(client, validating):
+    params = {"MessageSid": "SM1", "MessageStatus": "sent"}
+    response = client.post(
+        "/twilio/status",
+        data=params,
+        headers={"X-Twilio-Signature": _sign("http://localhost/twilio/status", params)},
+    )
+    assert response.status_code != 403
+
+
+@pytest.fixture()
+def not_validating(monkeypatch):
+    monkeypatch.setattr(webhooks, "_SIGNATURE_VALIDATION_DISABLED", True)
+
+
+def test_oversized_webhook_is_rejected_with_validation_disabled(client, not_validating):
+    body = "x" * (webhooks.MAX_TWILIO_WEBHOOK_BYTES + 1)
+    response = client.post("/twilio/status", data={"MessageSid": "SM1", "MessageStatus": "sent", "Body": body})
+    assert response.status_code == 403
+
+
+def test_multipart_form_part_limit(client, not_validating, app):
+    fields = {f"Field{i}": "v" for i in range(app.request_class.max_form_parts + 1)}
+    response = client.post("/twilio/status", data=fields, content_type="multipart/form-data")
+    assert response.status_code == 413
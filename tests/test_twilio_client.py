@@ -0,0 +1,20 @@
+import pytest
+
+from app import twilio_client
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [(None, 30.0), ("", 30.0), ("12.5", 12.5), ("abc", 30.0), ("0", 30.0), ("-3", 30.0)],
+)
+def test_http_timeout_from_env(monkeypatch, raw, expected):
+    if raw is None:
+        monkeypatch.delenv("TWILIO_HTTP_TIMEOUT", raising=False)
+    else:
+        monkeypatch.setenv("TWILIO_HTTP_TIMEOUT", raw)
+    assert twilio_client._http_timeout_from_env() == expected
+
+
+def test_service_client_uses_timeout(app):
+    service = app.config["TWILIO_CLIENT"]
+    assert service.client.http_client.timeout == twilio_client.TWILIO_HTTP_TIMEOUT